@@ -1,16 +1,25 @@
+from functools import lru_cache
 from pathlib import Path
 from typing import cast
 
+import yaml
 from omegaconf import DictConfig, OmegaConf
 
+# libyaml's C loader when PyYAML was built with it, the pure-Python one otherwise
+_YAMLLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
+
+@lru_cache(maxsize=1)
 def get_config() -> DictConfig:
     """
     Load and return configuration from config.yaml using OmegaConf.
+    The file is parsed once per process and the same object is returned afterwards.
 
     Returns:
         DictConfig: Configuration object from config.yaml
     """
     config_path: Path = Path(__file__).parent / "config.yaml"
-    config = cast(DictConfig, OmegaConf.load(config_path))
+    with open(config_path, "rb") as f:
+        data = yaml.load(f, Loader=_YAMLLoader)
+    config = cast(DictConfig, OmegaConf.create(data))
     return config
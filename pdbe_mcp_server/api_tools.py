@@ -1,7 +1,7 @@
-import json
 import logging
 import os
-import time
+import re
+from functools import lru_cache
 from typing import Any
 from urllib.parse import urljoin
 
@@ -10,17 +10,45 @@ import requests
 from omegaconf import DictConfig
 
 from pdbe_mcp_server import get_config
-from pdbe_mcp_server.utils import HTTPClient
+from pdbe_mcp_server.utils import HTTPClient, dumps_json
 
 logger = logging.getLogger(__name__)
 
 conf: DictConfig = get_config()
 
 
+_PATH_PARAM_RE = re.compile(r"\{([^{}]+)\}")
+
+
 def _toon_enabled() -> bool:
     return os.getenv("TOON_ENABLED", "false").lower() == "true"
 
 
+def _compile_path_template(path: str, path_params: list[str]) -> list[str]:
+    """
+    Split an OpenAPI path or URL into alternating literal and path parameter segments.
+
+    Placeholders that are not declared path parameters are kept as literal text,
+    so even indices hold literals and odd indices hold parameter names.
+
+    Args:
+        path: OpenAPI path or full URL, e.g. "/pdb/entry/{pdb_id}"
+        path_params: Names of the declared path parameters
+
+    Returns:
+        The segment list, e.g. ["/pdb/entry/", "pdb_id", ""]
+    """
+    segments = [""]
+    for index, part in enumerate(_PATH_PARAM_RE.split(path)):
+        if index % 2 == 0:
+            segments[-1] += part
+        elif part in path_params:
+            segments.extend((part, ""))
+        else:
+            segments[-1] += f"{{{part}}}"
+    return segments
+
+
 class OpenAPIToMCPGenerator:
     def __init__(self, openapi_url: str) -> None:
         """
@@ -33,6 +61,8 @@ class OpenAPIToMCPGenerator:
         self.openapi_spec: dict[str, Any] = {}
         self.base_url: str = str(conf.api.base_url)
         self.tools: list[dict[str, Any]] = []
+        self._tool_index: dict[str, dict[str, Any]] = {}
+        self._listed_tools: list[types.Tool] | None = None
 
     def load_openapi_spec(self) -> dict[str, Any]:
         """
@@ -42,7 +72,7 @@ class OpenAPIToMCPGenerator:
             The parsed OpenAPI specification as a dictionary
         """
         try:
-            spec = HTTPClient.get(self.openapi_url)
+            spec = HTTPClient.get(self.openapi_url, use_cache=True)
             self.openapi_spec = spec
             return spec
 
@@ -108,15 +138,17 @@ class OpenAPIToMCPGenerator:
         # Process path parameters
         for param in path_params:
             param_name = param["name"]
-            properties[param_name] = self._convert_openapi_type_to_json_schema(
-                param.get("schema", {})
-            )
             schema = param.get("schema", {})
+            properties[param_name] = self._convert_openapi_type_to_json_schema(schema)
             description = schema.get("description", "")
-            for key in schema:
-                description += f"\n{key}: {schema[key]}"
+            parts = [description] if description else []
+            parts.extend(
+                f"{key}: {value}"
+                for key, value in schema.items()
+                if key != "description"
+            )
 
-            properties[param_name]["description"] = description
+            properties[param_name]["description"] = "\n".join(parts)
             if param.get("required", False):
                 required.append(param_name)
 
@@ -140,6 +172,9 @@ class OpenAPIToMCPGenerator:
         Returns:
             List of MCP Tool objects
         """
+        if self._listed_tools is not None:
+            return self._listed_tools
+
         if not self.openapi_spec:
             self.load_openapi_spec()
 
@@ -149,11 +184,12 @@ class OpenAPIToMCPGenerator:
         for path, path_item in paths.items():
             for method, operation in path_item.items():
                 # Skip POST methods and non-HTTP methods
-                if method.upper() == "POST" or method.startswith("x-"):
+                http_method = method.upper()
+                if http_method == "POST" or method.startswith("x-"):
                     continue
 
                 # skip APIs which are not enabled for MCP
-                if not operation.get("enableMCP") or not operation["enableMCP"]:
+                if not operation.get("enableMCP"):
                     continue
 
                 # Generate tool name from operationId or path/method
@@ -176,9 +212,14 @@ class OpenAPIToMCPGenerator:
                 description = operation.get("description", operation.get("summary"))
 
                 # Extract parameters
-                parameters = operation.get("parameters", [])
-                path_params = [p for p in parameters if p.get("in") == "path"]
-                query_params = [p for p in parameters if p.get("in") == "query"]
+                path_params: list[dict[str, Any]] = []
+                query_params: list[dict[str, Any]] = []
+                for param in operation.get("parameters", []):
+                    location = param.get("in")
+                    if location == "path":
+                        path_params.append(param)
+                    elif location == "query":
+                        query_params.append(param)
 
                 properties, required = self._extract_parameters(
                     path_params, query_params
@@ -209,16 +250,22 @@ class OpenAPIToMCPGenerator:
                 tools.append(tool)
 
                 # Store tool metadata for call_tool function
+                path_param_names = [p["name"] for p in path_params]
                 self.tools.append(
                     {
                         "name": tool_name,
-                        "method": method.upper(),
+                        "method": http_method,
                         "path": path,
-                        "path_params": [p["name"] for p in path_params],
+                        "url_template": _compile_path_template(
+                            urljoin(self.base_url, path.lstrip("/")), path_param_names
+                        ),
+                        "path_params": path_param_names,
                         "query_params": [p["name"] for p in query_params],
                     }
                 )
+                self._tool_index[tool_name] = self.tools[-1]
 
+        self._listed_tools = tools
         return tools
 
     def call_tool(
@@ -235,57 +282,44 @@ class OpenAPIToMCPGenerator:
             List of TextContent with the API response
         """
         # Find the tool metadata
-        tool_info = None
-        for tool in self.tools:
-            if tool["name"] == name:
-                tool_info = tool
-                break
-
-        if not tool_info:
+        tool_info = self._tool_index.get(name)
+        if tool_info is None:
             raise ValueError(f"Unknown tool: {name}")
 
         # Build the URL
-        url_path = tool_info["path"]
-
-        # Replace path parameters
-        for param_name in tool_info["path_params"]:
-            if param_name not in arguments:
-                raise ValueError(f"Missing required path parameter: {param_name}")
-            url_path = url_path.replace(f"{{{param_name}}}", str(arguments[param_name]))
+        missing = [
+            param for param in tool_info["path_params"] if param not in arguments
+        ]
+        if missing:
+            raise ValueError(f"Missing required path parameters: {', '.join(missing)}")
 
-        # Build full URL
-        full_url = urljoin(self.base_url, url_path.lstrip("/"))
+        # Fill the precompiled URL template (base URL already joined) in one pass
+        url_parts = list(tool_info["url_template"])
+        url_parts[1::2] = [str(arguments[param]) for param in url_parts[1::2]]
+        full_url = "".join(url_parts)
 
         query_params = {}
         for param_name in tool_info["query_params"]:
             if param_name in arguments:
                 query_params[param_name] = arguments[param_name]
 
-        last_error: requests.RequestException | None = None
-        data = None
-        for attempt in range(3):
-            try:
-                if tool_info["method"] == "GET":
-                    data = HTTPClient.get(
-                        full_url, params=query_params if query_params else None
-                    )
-                elif tool_info["method"] == "POST":
-                    data = HTTPClient.post(full_url)
-                else:
-                    # unsupported method, raise an error
-                    raise ValueError(f"Unsupported method: {tool_info['method']}")
-                last_error = None
-                break
-            except requests.RequestException as e:
-                last_error = e
-                if attempt < 2:
-                    time.sleep(0.5)
-
-        if last_error is not None:
-            error_message = f"API request failed: {last_error}"
-            if hasattr(last_error, "response") and last_error.response is not None:
-                error_message += f"\nStatus Code: {last_error.response.status_code}"
-                error_message += f"\nResponse: {last_error.response.text}"
+        # Transient failures (connection errors, 429 and 5xx) are already retried
+        # with backoff by the session's urllib3 Retry, on pooled connections
+        try:
+            if tool_info["method"] == "GET":
+                data = HTTPClient.get(
+                    full_url, params=query_params if query_params else None
+                )
+            elif tool_info["method"] == "POST":
+                data = HTTPClient.post(full_url)
+            else:
+                # unsupported method, raise an error
+                raise ValueError(f"Unsupported method: {tool_info['method']}")
+        except requests.RequestException as e:
+            error_message = f"API request failed: {e}"
+            if hasattr(e, "response") and e.response is not None:
+                error_message += f"\nStatus Code: {e.response.status_code}"
+                error_message += f"\nResponse: {e.response.text}"
 
             return [types.TextContent(type="text", text=error_message)]
 
@@ -298,20 +332,23 @@ class OpenAPIToMCPGenerator:
                     result_text = str(result_text)
             except Exception as e:
                 logger.warning("TOON encoding failed, falling back to JSON: %s", e)
-                result_text = "TOON failed; JSON fallback:\n" + json.dumps(
-                    data, indent=2
-                )
+                result_text = "TOON failed; JSON fallback:\n" + dumps_json(data)
         else:
-            result_text = json.dumps(data, indent=2)
+            result_text = dumps_json(data)
         return [types.TextContent(type="text", text=result_text)]
 
 
+@lru_cache(maxsize=4)
 def create_mcp_tools_from_openapi(
     openapi_url: str,
 ) -> tuple[OpenAPIToMCPGenerator, list[types.Tool]]:
     """
     Main function to create MCP tools from an OpenAPI specification.
 
+    Results are memoized per URL, so servers built repeatedly in one process
+    share a single generator. The specification itself is disk-cached by
+    HTTPClient and only revalidated across process starts.
+
     Args:
         openapi_url: URL to the OpenAPI JSON specification
 
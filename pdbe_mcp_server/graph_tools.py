@@ -1,13 +1,14 @@
 import logging
 import os
 import re
+from functools import cached_property
 from typing import Any, LiteralString
 
 import mcp.types as types
 from omegaconf import DictConfig
 
 from pdbe_mcp_server import get_config
-from pdbe_mcp_server.utils import HTMLStripper, HTTPClient
+from pdbe_mcp_server.utils import HTMLStripper, HTTPClient, dumps_json
 
 logger = logging.getLogger(__name__)
 
@@ -49,23 +50,14 @@ def _toon_enabled() -> bool:
     return os.getenv("TOON_ENABLED", "false").lower() == "true"
 
 
-def _validate_cypher_query(query: str) -> tuple[bool, str | None]:
-    """
-    Validate a Cypher query to ensure it is read-only (no write, delete, or update operations).
+# Cypher validation patterns, compiled once rather than looked up per query
+_CYPHER_BLOCK_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_CYPHER_LINE_COMMENT_RE = re.compile(r"--.*$", re.MULTILINE)
 
-    Args:
-        query: The Cypher query to validate.
-
-    Returns:
-        Tuple of (is_valid, error_message). If valid, error_message is None.
-    """
-    # Normalize the query: remove comments, extra whitespace, convert to uppercase for matching
-    normalized = re.sub(r"/\*.*?\*/", "", query, flags=re.DOTALL)
-    normalized = re.sub(r"--.*$", "", normalized, flags=re.MULTILINE)
-    normalized = " ".join(normalized.upper().split())
-
-    # Cypher keywords that indicate write, delete, or update operations
-    write_patterns = [
+# Cypher keywords that indicate write, delete, or update operations
+_CYPHER_WRITE_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in (
         r"\bMERGE\b",
         r"\bCREATE\b",
         r"\bDELETE\b",
@@ -85,35 +77,55 @@ def _validate_cypher_query(query: str) -> tuple[bool, str | None]:
         r"\bLOAD\s+CSV\b",
         r"\bFOREACH\b",
         r"\bREMOVE\b\b",
-    ]
+    )
+)
+
+# Only allow queries that start with read operations
+_CYPHER_ALLOWED_STARTS = (re.compile(r"^(?:MATCH|OPTIONAL\s+MATCH|CALL\s*\{[^}]*\})"),)
 
-    for pattern in write_patterns:
-        if re.search(pattern, normalized):
+_CYPHER_RETURN_RE = re.compile(r"\bRETURN\b", re.IGNORECASE)
+_CYPHER_WRITE_KEYWORDS = tuple(
+    (keyword, re.compile(rf"\b{keyword}\b", re.IGNORECASE))
+    for keyword in ("MERGE", "CREATE", "DELETE", "REMOVE", "SET")
+)
+
+
+def _validate_cypher_query(query: str) -> tuple[bool, str | None]:
+    """
+    Validate a Cypher query to ensure it is read-only (no write, delete, or update operations).
+
+    Args:
+        query: The Cypher query to validate.
+
+    Returns:
+        Tuple of (is_valid, error_message). If valid, error_message is None.
+    """
+    # Normalize the query: remove comments, extra whitespace, convert to uppercase for matching
+    normalized = _CYPHER_BLOCK_COMMENT_RE.sub("", query)
+    normalized = _CYPHER_LINE_COMMENT_RE.sub("", normalized)
+    normalized = " ".join(normalized.upper().split())
+
+    for pattern in _CYPHER_WRITE_PATTERNS:
+        if pattern.search(normalized):
             return (
                 False,
-                f"Query contains potentially destructive operation (detected pattern: {pattern})",
+                f"Query contains potentially destructive operation (detected pattern: {pattern.pattern})",
             )
 
     # Additional check: allow only MATCH, OPTIONAL MATCH, CALL {MATCH ...}, RETURN
     # This is a safer approach - only allow queries that start with these read operations
-    allowed_starts = [
-        r"^(?:MATCH|OPTIONAL\s+MATCH|CALL\s*\{[^}]*\})",
-    ]
-
-    # Check if query matches allowed patterns
-    has_allowed_pattern = any(re.search(p, normalized) for p in allowed_starts)
+    has_allowed_pattern = any(p.search(normalized) for p in _CYPHER_ALLOWED_STARTS)
 
     # Additional check: if query contains write keywords after MATCH, it might be dangerous
     # This catches patterns like "MATCH ... RETURN ... MERGE"
-    write_keywords = ["MERGE", "CREATE", "DELETE", "REMOVE", "SET"]
     if has_allowed_pattern:
         # Check if any write operation appears after the initial MATCH/MATCH+CALL
-        parts = re.split(r"\bRETURN\b", normalized, flags=re.IGNORECASE)
+        parts = _CYPHER_RETURN_RE.split(normalized)
         if len(parts) > 1:
             # Everything after RETURN is part of RETURN clause, check the rest
             pre_return = parts[0]
-            for keyword in write_keywords:
-                if re.search(rf"\b{keyword}\b", pre_return, re.IGNORECASE):
+            for keyword, keyword_re in _CYPHER_WRITE_KEYWORDS:
+                if keyword_re.search(pre_return):
                     return (
                         False,
                         f"Query contains potentially destructive operation ({keyword}) after MATCH",
@@ -127,24 +139,11 @@ def _validate_cypher_query(query: str) -> tuple[bool, str | None]:
     return True, None
 
 
-class GraphTools:
-    """
-    A class to handle PDBe graph-related operations.
-    """
-
-    def __init__(self) -> None:
-        """
-        Initialize the GraphTools object, load the graph schema, and prepare node and edge lists.
-        """
-        self.graph_schema: dict[str, Any] = self._get_graph_schema()
-        self.node_dict: dict[Any, str] = {}
-        self.nodes: list[dict[str, Any]] = self.get_nodes()
-        self.edges: list[dict[str, Any]] = self.get_edges()
-
-    def get_pdbe_graph_nodes_tool(self) -> types.Tool:
-        return types.Tool(
-            name="pdbe_graph_nodes",
-            description="""
+# Tool definitions never change, so they are built once and shared by every
+# list_tools call.
+_GRAPH_NODES_TOOL = types.Tool(
+    name="pdbe_graph_nodes",
+    description="""
     Retrieves metadata about all node types (also known as "labels") defined in the PDBe (PDBe-KB) graph database schema.
     This tool can be used to understand the different types of entities represented in the PDBe graph database, along with
     their properties and descriptions and then can be used to explore the graph more effectively by writing Cypher queries.
@@ -164,23 +163,22 @@ class GraphTools:
 
     (Additional node labels follow the same format...)
     """,
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "additionalProperties": False,
-            },
-            annotations=types.ToolAnnotations(
-                title="Get PDBe Graph Nodes",
-                destructiveHint=False,
-                readOnlyHint=True,
-                idempotentHint=True,
-            ),
-        )
-
-    def get_pdbe_graph_edges_tool(self) -> types.Tool:
-        return types.Tool(
-            name="pdbe_graph_edges",
-            description="""
+    inputSchema={
+        "type": "object",
+        "properties": {},
+        "additionalProperties": False,
+    },
+    annotations=types.ToolAnnotations(
+        title="Get PDBe Graph Nodes",
+        destructiveHint=False,
+        readOnlyHint=True,
+        idempotentHint=True,
+    ),
+)
+
+_GRAPH_EDGES_TOOL = types.Tool(
+    name="pdbe_graph_edges",
+    description="""
     Retrieves metadata about all relationship types (edges) defined in the PDBe (PDBe-KB) graph database schema.
     This tool can be used to understand the different types of relationships represented in the PDBe graph database, along with
     their start and end nodes, properties and descriptions and then can be used to explore the graph more effectively by writing Cypher queries.
@@ -202,23 +200,22 @@ class GraphTools:
 
     (Additional relationship types follow the same format...)
     """,
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "additionalProperties": False,
-            },
-            annotations=types.ToolAnnotations(
-                title="Get PDBe Graph Edges",
-                destructiveHint=False,
-                readOnlyHint=True,
-                idempotentHint=True,
-            ),
-        )
-
-    def get_pdbe_graph_node_relationships_tool(self) -> types.Tool:
-        return types.Tool(
-            name="pdbe_graph_node_relationships",
-            description="""
+    inputSchema={
+        "type": "object",
+        "properties": {},
+        "additionalProperties": False,
+    },
+    annotations=types.ToolAnnotations(
+        title="Get PDBe Graph Edges",
+        destructiveHint=False,
+        readOnlyHint=True,
+        idempotentHint=True,
+    ),
+)
+
+_GRAPH_NODE_RELATIONSHIPS_TOOL = types.Tool(
+    name="pdbe_graph_node_relationships",
+    description="""
     Verifies one or more PDBe graph node labels and returns the relationships connected to each label.
     Use this tool after inspecting the node and edge schema, when you have selected node labels for a Cypher query
     and want to confirm that the labels and relationship directions exist in the PDBe graph schema.
@@ -247,31 +244,30 @@ class GraphTools:
     Node: FakeNode
     Status: Not found in schema
     """,
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "node_labels": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "minItems": 1,
-                        "description": "Exact, case-sensitive node labels to verify against the PDBe graph schema.",
-                    }
-                },
-                "required": ["node_labels"],
-                "additionalProperties": False,
-            },
-            annotations=types.ToolAnnotations(
-                title="Verify PDBe Graph Node Relationships",
-                destructiveHint=False,
-                readOnlyHint=True,
-                idempotentHint=True,
-            ),
-        )
-
-    def get_pdbe_graph_example_queries_tool(self) -> types.Tool:
-        return types.Tool(
-            name="pdbe_graph_example_queries",
-            description="""
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "node_labels": {
+                "type": "array",
+                "items": {"type": "string"},
+                "minItems": 1,
+                "description": "Exact, case-sensitive node labels to verify against the PDBe graph schema.",
+            }
+        },
+        "required": ["node_labels"],
+        "additionalProperties": False,
+    },
+    annotations=types.ToolAnnotations(
+        title="Verify PDBe Graph Node Relationships",
+        destructiveHint=False,
+        readOnlyHint=True,
+        idempotentHint=True,
+    ),
+)
+
+_GRAPH_EXAMPLE_QUERIES_TOOL = types.Tool(
+    name="pdbe_graph_example_queries",
+    description="""
     Retrieves example Cypher queries for exploring the PDBe (PDBe-KB) graph database.
     This tool can be used to get sample queries that demonstrate how to interact with the PDBe graph database using Cypher.
     The tool returns a list of example queries, each with an question describing the purpose of the query and the corresponding Cypher query string.
@@ -289,23 +285,22 @@ class GraphTools:
     ORDER BY entry.PDB_REV_DATE DESC
     (Additional example queries follow the same format...)
     """,
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "additionalProperties": False,
-            },
-            annotations=types.ToolAnnotations(
-                title="Get PDBe Graph Example Queries",
-                destructiveHint=False,
-                readOnlyHint=True,
-                idempotentHint=True,
-            ),
-        )
-
-    def get_pdbe_run_cypher_query_tool(self) -> types.Tool:
-        return types.Tool(
-            name="pdbe_run_cypher_query",
-            description="""
+    inputSchema={
+        "type": "object",
+        "properties": {},
+        "additionalProperties": False,
+    },
+    annotations=types.ToolAnnotations(
+        title="Get PDBe Graph Example Queries",
+        destructiveHint=False,
+        readOnlyHint=True,
+        idempotentHint=True,
+    ),
+)
+
+_RUN_CYPHER_QUERY_TOOL = types.Tool(
+    name="pdbe_run_cypher_query",
+    description="""
     Execute a read-only Cypher query against the PDBe (PDBe-KB) Neo4j graph database.
     This tool allows you to run custom MATCH or OPTIONAL MATCH queries to explore complex relationships and data in the PDBe graph.
     Only read-only queries are allowed (MATCH, OPTIONAL MATCH, CALL {MATCH ...}).
@@ -323,24 +318,93 @@ class GraphTools:
         MATCH (s:Structure)-[r:HAS_LIGAND]->(l:Ligand) WHERE s.PDB_ID = '1abc' RETURN l.name as ligand, count(r) as binding_count
         OPTIONAL MATCH (s:Structure) WHERE s.PDB_ID = '9xyz' RETURN s.PDB_ID as id, s.TITLE as title
     """,
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "cypher_query": {
-                        "type": "string",
-                        "description": "The Cypher query to execute. Only MATCH and OPTIONAL MATCH queries are allowed. MERGE, CREATE, DELETE, REMOVE, SET, LOAD CSV, and FOREACH operations are not permitted.",
-                    }
-                },
-                "required": ["cypher_query"],
-                "additionalProperties": False,
-            },
-            annotations=types.ToolAnnotations(
-                title="Run Cypher Query",
-                destructiveHint=False,
-                readOnlyHint=True,
-                idempotentHint=True,
-            ),
-        )
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "cypher_query": {
+                "type": "string",
+                "description": "The Cypher query to execute. Only MATCH and OPTIONAL MATCH queries are allowed. MERGE, CREATE, DELETE, REMOVE, SET, LOAD CSV, and FOREACH operations are not permitted.",
+            }
+        },
+        "required": ["cypher_query"],
+        "additionalProperties": False,
+    },
+    annotations=types.ToolAnnotations(
+        title="Run Cypher Query",
+        destructiveHint=False,
+        readOnlyHint=True,
+        idempotentHint=True,
+    ),
+)
+
+
+class GraphTools:
+    """
+    A class to handle PDBe graph-related operations.
+    """
+
+    @cached_property
+    def graph_schema(self) -> dict[str, Any]:
+        """
+        The PDBe graph schema, fetched on first access.
+        """
+        return self._get_graph_schema()
+
+    @cached_property
+    def nodes(self) -> list[dict[str, Any]]:
+        """
+        The cleaned-up node list, built on first access.
+        """
+        return self.get_nodes()
+
+    @cached_property
+    def edges(self) -> list[dict[str, Any]]:
+        """
+        The cleaned-up edge list, built on first access.
+        """
+        return self.get_edges()
+
+    @cached_property
+    def node_dict(self) -> dict[Any, str]:
+        """
+        Mapping of node IDs to node labels for quick label lookup.
+        """
+        return {node.get("id"): node["label"] for node in self.nodes}
+
+    @cached_property
+    def _node_by_label(self) -> dict[str, dict[str, Any]]:
+        """
+        Mapping of node labels to node dictionaries, keeping the first occurrence.
+        """
+        index: dict[str, dict[str, Any]] = {}
+        for node in self.nodes:
+            index.setdefault(node.get("label"), node)
+        return index
+
+    @cached_property
+    def _edge_by_label(self) -> dict[str, dict[str, Any]]:
+        """
+        Mapping of edge labels to edge dictionaries, keeping the first occurrence.
+        """
+        index: dict[str, dict[str, Any]] = {}
+        for edge in self.edges:
+            index.setdefault(edge.get("label"), edge)
+        return index
+
+    def get_pdbe_graph_nodes_tool(self) -> types.Tool:
+        return _GRAPH_NODES_TOOL
+
+    def get_pdbe_graph_edges_tool(self) -> types.Tool:
+        return _GRAPH_EDGES_TOOL
+
+    def get_pdbe_graph_node_relationships_tool(self) -> types.Tool:
+        return _GRAPH_NODE_RELATIONSHIPS_TOOL
+
+    def get_pdbe_graph_example_queries_tool(self) -> types.Tool:
+        return _GRAPH_EXAMPLE_QUERIES_TOOL
+
+    def get_pdbe_run_cypher_query_tool(self) -> types.Tool:
+        return _RUN_CYPHER_QUERY_TOOL
 
     def _get_graph_schema(self) -> dict[str, Any]:
         """
@@ -354,48 +418,82 @@ class GraphTools:
 
                 return json.load(f)
         else:
-            return HTTPClient.get(str(conf.graph.schema_url))
+            return HTTPClient.get(str(conf.graph.schema_url), use_cache=True)
 
     def get_nodes(self) -> list[dict[str, Any]]:
         """
-        Get the nodes from the graph schema, clean up their descriptions and titles, and store them in a list.
-        Also populates the node_dict for quick label lookup.
+        Get the nodes from the graph schema, cleaning up their descriptions and titles in place.
+
+        The schema is this instance's own parsed copy (see ResponseCache), so
+        cleaning it in place does not affect other callers.
 
         Returns:
-            List of node dictionaries.
+            The schema's list of node dictionaries.
         """
-        nodes = []
-        for node in self.graph_schema.get("nodes", []):
+        nodes = self.graph_schema.get("nodes", [])
+        strip = HTMLStripper.strip_tags
+        for node in nodes:
             # clean up the node data
-            node["description"] = HTMLStripper.strip_tags(node.get("description", ""))
-            node["title"] = HTMLStripper.strip_tags(node.get("title", ""))
-            for prop in node.get("properties", []):
-                prop["value"] = HTMLStripper.strip_tags(prop.get("value", ""))
-            nodes.append(node)
-
-            # store the node label in a dictionary for quick access
-            self.node_dict[node.get("id")] = node["label"]
+            node["description"] = strip(node.get("description", ""))
+            node["title"] = strip(node.get("title", ""))
+            for prop in node.get("properties", ()):
+                prop["value"] = strip(prop.get("value", ""))
 
         return nodes
 
     def get_edges(self) -> list[dict[str, Any]]:
         """
-        Get the edges from the graph schema, clean up their descriptions and titles, and store them in a list.
+        Get the edges from the graph schema, cleaning up their descriptions and titles in place.
 
         Returns:
-            List of edge dictionaries.
+            The schema's list of edge dictionaries.
         """
-        edges = []
-        for edge in self.graph_schema.get("edges", []):
+        edges = self.graph_schema.get("edges", [])
+        strip = HTMLStripper.strip_tags
+        for edge in edges:
             # clean up the edge data
-            edge["description"] = HTMLStripper.strip_tags(edge.get("description", ""))
-            edge["title"] = HTMLStripper.strip_tags(edge.get("title", ""))
-            for prop in edge.get("properties", []):
-                prop["value"] = HTMLStripper.strip_tags(prop.get("value", ""))
-            edges.append(edge)
+            edge["description"] = strip(edge.get("description", ""))
+            edge["title"] = strip(edge.get("title", ""))
+            for prop in edge.get("properties", ()):
+                prop["value"] = strip(prop.get("value", ""))
 
         return edges
 
+    @cached_property
+    def nodes_text(self) -> str:
+        """
+        The formatted node listing, built once since the schema is static.
+        """
+        lines: list[str] = []
+        append = lines.append
+        for node in self.nodes:
+            if lines:
+                append("")  # Blank line between nodes
+            append(f"Label: {node['label']}")
+            append(f"Description: {node.get('description', '')}")
+            self._append_properties(lines, node.get("properties"))
+
+        return "\n".join(lines)
+
+    @cached_property
+    def edges_text(self) -> str:
+        """
+        The formatted edge listing, built once since the schema is static.
+        """
+        node_dict = self.node_dict
+        lines: list[str] = []
+        append = lines.append
+        for edge in self.edges:
+            if lines:
+                append("")  # Blank line between edges
+            append(f"Label: {edge['label']}")
+            append(f"Description: {edge.get('description', '')}")
+            append(f"From: {node_dict.get(edge.get('from'), edge.get('from'))}")
+            append(f"To: {node_dict.get(edge.get('to'), edge.get('to'))}")
+            self._append_properties(lines, edge.get("properties"))
+
+        return "\n".join(lines)
+
     def format_nodes(self) -> str:
         """
         Format the nodes as a string for LLM or human-readable output.
@@ -403,19 +501,7 @@ class GraphTools:
         Returns:
             A formatted string listing all nodes and their properties.
         """
-        return "\n\n".join(
-            f"Label: {node['label']}\nDescription: {node.get('description', '')}\n"
-            + (
-                "Properties:\n"
-                + "\n".join(
-                    f"  - {prop.get('name', '')}: {prop.get('value', '')}"
-                    for prop in node.get("properties", [])
-                )
-                if node.get("properties")
-                else "Properties: None"
-            )
-            for node in self.nodes
-        )
+        return self.nodes_text
 
     def format_edges(self) -> str:
         """
@@ -424,21 +510,27 @@ class GraphTools:
         Returns:
             A formatted string listing all edges and their properties.
         """
-        return "\n\n".join(
-            f"Label: {edge['label']}\n"
-            f"Description: {edge.get('description', '')}\n"
-            f"From: {self.node_dict.get(edge.get('from'), edge.get('from'))}\n"
-            f"To: {self.node_dict.get(edge.get('to'), edge.get('to'))}\n"
-            + (
-                "Properties:\n"
-                + "\n".join(
-                    f"  - {prop.get('name', '')}: {prop.get('value', '')}"
-                    for prop in edge.get("properties", [])
-                )
-                if edge.get("properties")
-                else "Properties: None"
-            )
-            for edge in self.edges
+        return self.edges_text
+
+    @staticmethod
+    def _append_properties(
+        lines: list[str], properties: list[dict[str, Any]] | None
+    ) -> None:
+        """
+        Append the formatted property lines of a node or edge to an output buffer.
+
+        Args:
+            lines: Output buffer to append to.
+            properties: Property dictionaries with "name" and "value" keys.
+        """
+        if not properties:
+            lines.append("Properties: None")
+            return
+
+        lines.append("Properties:")
+        lines.extend(
+            f"  - {prop.get('name', '')}: {prop.get('value', '')}"
+            for prop in properties
         )
 
     def _edge_node_label(self, edge: dict[str, Any], endpoint: str) -> str:
@@ -593,16 +685,16 @@ class GraphTools:
         Returns:
             A formatted string with node information, or None if not found.
         """
-        for node in self.nodes:
-            if node.get("label") == node_label:
-                # format the node
-                return f"""
+        node = self._node_by_label.get(node_label)
+        if node is None:
+            return None
+
+        # format the node
+        return f"""
                 Label: {node_label}
                 Description: {node.get("description")}
                 """
 
-        return None
-
     def get_edge_by_label(self, edge_label: str) -> dict[str, Any] | None:
         """
         Get an edge dictionary by its label.
@@ -613,10 +705,17 @@ class GraphTools:
         Returns:
             The edge dictionary if found, otherwise None.
         """
-        for edge in self.edges:
-            if edge.get("label") == edge_label:
-                return edge
-        return None
+        return self._edge_by_label.get(edge_label)
+
+    @cached_property
+    def example_queries_text(self) -> str:
+        """
+        The formatted example queries, built once since the schema is static.
+        """
+        return "\n\n".join(
+            f"Question: {query.get('description', '')}\nQuery:\n{query.get('query', '')}"
+            for query in self.graph_schema.get("examples", [])
+        )
 
     def format_example_queries(self) -> str:
         """
@@ -625,10 +724,7 @@ class GraphTools:
         Returns:
             A formatted string listing example queries.
         """
-        return "\n\n".join(
-            f"Question: {query.get('description', '')}\nQuery:\n{query.get('query', '')}"
-            for query in self.graph_schema.get("examples", [])
-        )
+        return self.example_queries_text
 
     def _get_neo4j_config(self) -> dict[str, str]:
         """
@@ -743,15 +839,11 @@ class GraphTools:
                         logger.warning(
                             "TOON encoding failed, falling back to JSON: %s", e
                         )
-                        import json
-
-                        result_text = "TOON failed; JSON fallback:\n" + json.dumps(
-                            results, indent=2, default=str
+                        result_text = "TOON failed; JSON fallback:\n" + dumps_json(
+                            results, default=str
                         )
                 else:
-                    import json
-
-                    result_text = json.dumps(results, indent=2, default=str)
+                    result_text = dumps_json(results, default=str)
 
                 return result_text
 
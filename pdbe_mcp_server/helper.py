@@ -1,45 +1,45 @@
-from typing import Any
+import io
+from typing import Any, Callable
+
+
+def _write_properties(
+    write: Callable[[str], int], properties: list[dict[str, Any]] | None
+) -> None:
+    write("Properties:\n")
+
+    if properties:
+        for prop in properties:
+            name = prop.get("name", "<No name>")
+            value = prop.get("value", "<No description>")
+            write(f"  - {name}: {value}\n")
+    else:
+        write("  None\n")
 
 
 def format_graph_info(graph_data: dict[str, Any]) -> str:
-    output = []
+    buffer = io.StringIO()
+    write = buffer.write
 
     # Format Nodes
-    output.append("Nodes\n" + "=" * 5 + "\n")
+    write("Nodes\n" + "=" * 5 + "\n\n")
 
     for node in graph_data.get("nodes", []):
-        output.append(f"Label: {node['label']}")
-        output.append(f"Description: {node['description']}")
-        output.append("Properties:")
-
-        if node.get("properties"):
-            for prop in node["properties"]:
-                name = prop.get("name", "<No name>")
-                value = prop.get("value", "<No description>")
-                output.append(f"  - {name}: {value}")
-        else:
-            output.append("  None")
-
-        output.append("")  # Blank line between nodes
+        write(f"Label: {node['label']}\n")
+        write(f"Description: {node['description']}\n")
+        _write_properties(write, node.get("properties"))
+        write("\n")  # Blank line between nodes
 
     # Format Edges (Relationships)
-    output.append("Relationships\n" + "=" * 12 + "\n")
+    write("Relationships\n" + "=" * 12 + "\n\n")
 
     for edge in graph_data.get("edges", []):
-        output.append(f"Label: {edge['label']}")
-        output.append(f"Description: {edge['description']}")
-        output.append(f"From Node ID: {edge['from']}")
-        output.append(f"To Node ID: {edge['to']}")
-        output.append("Properties:")
-
-        if edge.get("properties"):
-            for prop in edge["properties"]:
-                name = prop.get("name", "<No name>")
-                value = prop.get("value", "<No description>")
-                output.append(f"  - {name}: {value}")
-        else:
-            output.append("  None")
-
-        output.append("")  # Blank line between edges
-
-    return "\n".join(output)
+        write(f"Label: {edge['label']}\n")
+        write(f"Description: {edge['description']}\n")
+        write(f"From Node ID: {edge['from']}\n")
+        write(f"To Node ID: {edge['to']}\n")
+        _write_properties(write, edge.get("properties"))
+        write("\n")  # Blank line between edges
+
+    # Every line above ends with a newline; drop the final one so the result
+    # matches joining the lines with "\n".
+    return buffer.getvalue()[:-1]
@@ -1,4 +1,6 @@
 import json
+import time
+from itertools import chain
 from typing import Any
 from urllib.parse import urlencode
 
@@ -12,11 +14,63 @@ from pdbe_mcp_server.utils import HTTPClient
 conf: DictConfig = get_config()
 
 
-class SearchTools:
-    def get_run_search_query_tool(self) -> types.Tool:
-        return types.Tool(
-            name="run_search_query",
-            description="""
+def _field_list_schema() -> dict[str, Any]:
+    """Input schema for the Solr field list (``fl``) argument."""
+    return {
+        "oneOf": [
+            {"type": "string"},
+            {
+                "type": "array",
+                "items": {"type": "string"},
+            },
+        ],
+    }
+
+
+def _filter_query_schema() -> dict[str, Any]:
+    """Input schema for the Solr filter query (``fq``) argument."""
+    return {
+        "oneOf": [
+            {"type": "string"},
+            {
+                "type": "object",
+                "additionalProperties": {
+                    "oneOf": [
+                        {"type": "string"},
+                        {"type": "number"},
+                        {"type": "integer"},
+                        {"type": "boolean"},
+                    ]
+                },
+            },
+            {
+                "type": "array",
+                "items": {
+                    "oneOf": [
+                        {"type": "string"},
+                        {
+                            "type": "object",
+                            "additionalProperties": {
+                                "oneOf": [
+                                    {"type": "string"},
+                                    {"type": "number"},
+                                    {"type": "integer"},
+                                    {"type": "boolean"},
+                                ]
+                            },
+                        },
+                    ]
+                },
+            },
+        ],
+    }
+
+
+# Tool definitions never change, so they are built once and shared by every
+# list_tools call.
+_RUN_SEARCH_QUERY_TOOL = types.Tool(
+    name="run_search_query",
+    description="""
 Executes a search query against the PDBe Solr search service.
     This tool exposes common Solr query parameters directly so users can construct fielded queries, filter queries, field lists, facets, grouping, sorting, and pagination against the PDBe search index.
     IMPORTANT: `query` is passed to Solr as the raw `q` parameter. Use Solr query syntax such as `*:*`, `pdb_id:1cbs`, `text:*kinase*`, boolean clauses, ranges, and boosts as needed.
@@ -56,141 +110,189 @@ Executes a search query against the PDBe Solr search service.
     - A list of documents matching the search query, with each document's fields and values clearly presented.
     The output will be structured to facilitate easy interpretation of the search results, allowing users to quickly identify relevant information.
             """,
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {"type": "string"},
-                    "fl": {
-                        "oneOf": [
-                            {"type": "string"},
-                            {
-                                "type": "array",
-                                "items": {"type": "string"},
-                            },
-                        ],
-                    },
-                    "filters": {
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "query": {"type": "string"},
+            "fl": _field_list_schema(),
+            "filters": {
+                "type": "array",
+                "items": {"type": "string"},
+            },
+            "fq": _filter_query_schema(),
+            "sort": {"type": "string"},
+            "start": {"type": "integer"},
+            "rows": {"type": "integer"},
+            "facet": {"type": "boolean"},
+            "facet_fields": {
+                "oneOf": [
+                    {"type": "string"},
+                    {
                         "type": "array",
                         "items": {"type": "string"},
                     },
-                    "fq": {
-                        "oneOf": [
-                            {"type": "string"},
-                            {
-                                "type": "object",
-                                "additionalProperties": {
-                                    "oneOf": [
-                                        {"type": "string"},
-                                        {"type": "number"},
-                                        {"type": "integer"},
-                                        {"type": "boolean"},
-                                    ]
-                                },
-                            },
-                            {
-                                "type": "array",
-                                "items": {
-                                    "oneOf": [
-                                        {"type": "string"},
-                                        {
-                                            "type": "object",
-                                            "additionalProperties": {
-                                                "oneOf": [
-                                                    {"type": "string"},
-                                                    {"type": "number"},
-                                                    {"type": "integer"},
-                                                    {"type": "boolean"},
-                                                ]
-                                            },
-                                        },
-                                    ]
-                                },
-                            },
-                        ],
-                    },
-                    "sort": {"type": "string"},
-                    "start": {"type": "integer"},
-                    "rows": {"type": "integer"},
-                    "facet": {"type": "boolean"},
-                    "facet_fields": {
-                        "oneOf": [
-                            {"type": "string"},
-                            {
-                                "type": "array",
-                                "items": {"type": "string"},
-                            },
-                        ],
+                ],
+            },
+            "facet_queries": {
+                "oneOf": [
+                    {"type": "string"},
+                    {
+                        "type": "array",
+                        "items": {"type": "string"},
                     },
-                    "facet_queries": {
-                        "oneOf": [
-                            {"type": "string"},
-                            {
-                                "type": "array",
-                                "items": {"type": "string"},
-                            },
-                        ],
+                ],
+            },
+            "facet_limit": {"type": "integer"},
+            "facet_mincount": {"type": "integer"},
+            "facet_sort": {"type": "string"},
+            "group": {"type": "boolean"},
+            "group_field": {
+                "oneOf": [
+                    {"type": "string"},
+                    {
+                        "type": "array",
+                        "items": {"type": "string"},
                     },
-                    "facet_limit": {"type": "integer"},
-                    "facet_mincount": {"type": "integer"},
-                    "facet_sort": {"type": "string"},
-                    "group": {"type": "boolean"},
-                    "group_field": {
-                        "oneOf": [
-                            {"type": "string"},
-                            {
-                                "type": "array",
-                                "items": {"type": "string"},
-                            },
-                        ],
+                ],
+            },
+            "group_limit": {"type": "integer"},
+            "group_offset": {"type": "integer"},
+            "group_sort": {"type": "string"},
+            "group_format": {"type": "string"},
+            "group_main": {"type": "boolean"},
+            "group_ngroups": {"type": "boolean"},
+            "group_query": {
+                "oneOf": [
+                    {"type": "string"},
+                    {
+                        "type": "array",
+                        "items": {"type": "string"},
                     },
-                    "group_limit": {"type": "integer"},
-                    "group_offset": {"type": "integer"},
-                    "group_sort": {"type": "string"},
-                    "group_format": {"type": "string"},
-                    "group_main": {"type": "boolean"},
-                    "group_ngroups": {"type": "boolean"},
-                    "group_query": {
-                        "oneOf": [
-                            {"type": "string"},
-                            {
-                                "type": "array",
-                                "items": {"type": "string"},
+                ],
+            },
+            "params": {
+                "type": "object",
+                "additionalProperties": {
+                    "oneOf": [
+                        {"type": "string"},
+                        {"type": "number"},
+                        {"type": "integer"},
+                        {"type": "boolean"},
+                        {
+                            "type": "array",
+                            "items": {
+                                "oneOf": [
+                                    {"type": "string"},
+                                    {"type": "number"},
+                                    {"type": "integer"},
+                                    {"type": "boolean"},
+                                ]
                             },
-                        ],
-                    },
-                    "params": {
-                        "type": "object",
-                        "additionalProperties": {
-                            "oneOf": [
-                                {"type": "string"},
-                                {"type": "number"},
-                                {"type": "integer"},
-                                {"type": "boolean"},
-                                {
-                                    "type": "array",
-                                    "items": {
-                                        "oneOf": [
-                                            {"type": "string"},
-                                            {"type": "number"},
-                                            {"type": "integer"},
-                                            {"type": "boolean"},
-                                        ]
-                                    },
-                                },
-                            ]
                         },
-                    },
+                    ]
                 },
-                "required": ["query"],
-                "additionalProperties": False,
             },
-            annotations=types.ToolAnnotations(
-                title="Run PDBe Search Query",
-                destructiveHint=False,
-                readOnlyHint=True,
-                idempotentHint=True,
-            ),
-        )
+        },
+        "required": ["query"],
+        "additionalProperties": False,
+    },
+    annotations=types.ToolAnnotations(
+        title="Run PDBe Search Query",
+        destructiveHint=False,
+        readOnlyHint=True,
+        idempotentHint=True,
+    ),
+)
+
+_SEARCH_SCHEMA_TOOL = types.Tool(
+    name="get_search_schema",
+    description="""
+Retrieves the Solr search schema for the PDBe search service. You can use this tool to understand the structure and fields available in the PDBe search index. Once you have the schema, you can use it to construct more effective search queries and run the query using the `run_search_query` tool.
+    This tool returns a detailed schema of the Solr search index used by PDBe. The schema includes information about all the fields available for searching, along with their types, whether they are stored or indexed, and any relevant descriptions.
+    Expected Output Format:
+    A text representation of the search schema, formatted as a table with the following columns:
+    - Field Name: The name of the field in the Solr schema.
+    - Type: The data type of the field (e.g. string, integer, date).
+    - Stored: Indicates whether the field is stored in the index (true/false).
+    - Indexed: Indicates whether the field is indexed for searching (true/false).
+    - Description: A brief description of the field and its purpose.
+    The output will be structured in a way that is easy to read and understand, allowing users to quickly grasp the available search fields and their characteristics.
+            """,
+    inputSchema={
+        "type": "object",
+        "properties": {},
+        "additionalProperties": False,
+    },
+    annotations=types.ToolAnnotations(
+        title="Get PDBe Search Schema",
+        destructiveHint=False,
+        readOnlyHint=True,
+        idempotentHint=True,
+    ),
+)
+
+
+_RUN_SEARCH_QUERY_BATCH_TOOL = types.Tool(
+    name="run_search_query_batch",
+    description="""
+Executes several search queries against the PDBe Solr search service in a single request.
+    Use this tool instead of calling `run_search_query` repeatedly when you need results for a list of independent queries, e.g. looking up several PDB entries by ID. All queries are sent to Solr together and the results are returned grouped per query, which saves one network round-trip per additional query.
+    Expected Input Parameters:
+    - queries (list of strings): Raw Solr query strings, one per group of results, e.g. ["pdb_id:1cbs", "pdb_id:2abc"].
+    - fl (string or list of strings, optional): Solr field list applied to every query.
+    - fq (string, object, list of strings, or list of objects, optional): Solr filter queries applied to every query.
+    - sort (string, optional): The sorting criteria within each group.
+    - rows (integer, optional): The number of results to return for each query.
+
+    Example Input:
+    {
+        "queries": ["pdb_id:1cbs", "pdb_id:2abc", "pdb_id:3xyz"],
+        "fl": ["pdb_id", "title", "resolution"],
+        "rows": 1
+    }
+
+    Expected Output Format:
+    A text representation of the grouped search results. Each group is labelled with its query and lists the number of matching documents followed by the documents themselves, in the same format as `run_search_query`.
+            """,
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "queries": {
+                "type": "array",
+                "items": {"type": "string"},
+                "minItems": 1,
+            },
+            "fl": _field_list_schema(),
+            "fq": _filter_query_schema(),
+            "sort": {"type": "string"},
+            "rows": {"type": "integer"},
+        },
+        "required": ["queries"],
+        "additionalProperties": False,
+    },
+    annotations=types.ToolAnnotations(
+        title="Run PDBe Search Query Batch",
+        destructiveHint=False,
+        readOnlyHint=True,
+        idempotentHint=True,
+    ),
+)
+
+
+class SearchTools:
+    # Seconds the formatted Solr schema is reused before it is fetched again
+    SCHEMA_TTL: float = 3600.0
+
+    def __init__(self) -> None:
+        self.search_api: str = str(conf.search.search_api)
+        self.schema_url: str = str(conf.search.schema_url)
+        self._schema_cache: tuple[float, str] | None = None
+
+    def get_run_search_query_tool(self) -> types.Tool:
+        return _RUN_SEARCH_QUERY_TOOL
+
+    def get_run_search_query_batch_tool(self) -> types.Tool:
+        return _RUN_SEARCH_QUERY_BATCH_TOOL
 
     @staticmethod
     def _parse_json_like_string(value: Any) -> Any:
@@ -282,7 +384,7 @@ Executes a search query against the PDBe Solr search service.
     def _format_document(doc: dict[str, Any], indent: int = 2) -> list[str]:
         prefix = " " * indent
         return [
-            f"{prefix}{key}: {', '.join(str(v) for v in value) if isinstance(value, list) else str(value)}"
+            f"{prefix}{key}: {', '.join(map(str, value)) if isinstance(value, list) else value}"
             for key, value in doc.items()
         ]
 
@@ -314,13 +416,13 @@ Executes a search query against the PDBe Solr search service.
 
     @classmethod
     def _format_grouped_results(
-        cls, grouped: dict[str, Any], indent: int = 0
+        cls, grouped: dict[str, Any], indent: int = 0, label: str = "Group field"
     ) -> list[str]:
         prefix = " " * indent
         lines: list[str] = []
 
         for group_field, group_data in grouped.items():
-            lines.append(f"{prefix}Group field: {group_field}")
+            lines.append(f"{prefix}{label}: {group_field}")
 
             if not isinstance(group_data, dict):
                 lines.extend(cls._format_value(group_data, indent + 2))
@@ -513,46 +615,32 @@ Executes a search query against the PDBe Solr search service.
         return "\n".join(lines)
 
     def get_search_schema_tool(self) -> types.Tool:
-        return types.Tool(
-            name="get_search_schema",
-            description="""
-Retrieves the Solr search schema for the PDBe search service. You can use this tool to understand the structure and fields available in the PDBe search index. Once you have the schema, you can use it to construct more effective search queries and run the query using the `run_search_query` tool.
-    This tool returns a detailed schema of the Solr search index used by PDBe. The schema includes information about all the fields available for searching, along with their types, whether they are stored or indexed, and any relevant descriptions.
-    Expected Output Format:
-    A text representation of the search schema, formatted as a table with the following columns:
-    - Field Name: The name of the field in the Solr schema.
-    - Type: The data type of the field (e.g. string, integer, date).
-    - Stored: Indicates whether the field is stored in the index (true/false).
-    - Indexed: Indicates whether the field is indexed for searching (true/false).
-    - Description: A brief description of the field and its purpose.
-    The output will be structured in a way that is easy to read and understand, allowing users to quickly grasp the available search fields and their characteristics.
-            """,
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "additionalProperties": False,
-            },
-            annotations=types.ToolAnnotations(
-                title="Get PDBe Search Schema",
-                destructiveHint=False,
-                readOnlyHint=True,
-                idempotentHint=True,
-            ),
+        return _SEARCH_SCHEMA_TOOL
+
+    def get_search_schema(self, refresh: bool = False) -> str:
+        cached = self._schema_cache
+        if not refresh and cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+
+        # The disk-backed response cache revalidates with ETag/Last-Modified, so
+        # an unchanged schema costs a 304 instead of a full download
+        schema = HTTPClient.get(self.schema_url, use_cache=True)
+        rows = (
+            f"{field}; {values.get('type')}; {values.get('stored')}; {values.get('indexed')}; {values.get('description')}"
+            for field, values in schema.get("fields", {}).items()
         )
-
-    def get_search_schema(self) -> str:
-        schema = HTTPClient.get(conf.search.schema_url)
-        content = ["Field Name;Type;Stored;Indexed;Description"]
-        for field, values in schema.get("fields", {}).items():
-            content.append(
-                f"{field}; {values.get('type')}; {values.get('stored')}; {values.get('indexed')}; {values.get('description')}"
-            )
-
-        return "\n".join(content)
+        text = "\n".join(chain(("Field Name;Type;Stored;Indexed;Description",), rows))
+        self._schema_cache = (time.monotonic() + self.SCHEMA_TTL, text)
+        return text
 
     def run_search_query(self, arguments: dict[str, Any]) -> str:
+        return self._run_search_query(arguments)
+
+    def _run_search_query(
+        self, arguments: dict[str, Any], group_label: str = "Group field"
+    ) -> str:
         fields = self._build_solr_params(arguments)
-        search_url = self._build_solr_url(conf.search.search_api, fields)
+        search_url = self._build_solr_url(self.search_api, fields)
         try:
             data = HTTPClient.get(search_url)
         except requests.HTTPError as e:
@@ -599,7 +687,11 @@ Retrieves the Solr search schema for the PDBe search service. You can use this t
 
         if "grouped" in data:
             results.append("Grouped results:")
-            results.extend(self._format_grouped_results(data["grouped"], indent=2))
+            results.extend(
+                self._format_grouped_results(
+                    data["grouped"], indent=2, label=group_label
+                )
+            )
 
         for key in ("stats", "highlighting", "spellcheck", "terms"):
             if key in data:
@@ -607,3 +699,30 @@ Retrieves the Solr search schema for the PDBe search service. You can use this t
                 results.extend(self._format_value(data[key], indent=2))
 
         return "\n".join(results)
+
+    def run_search_query_batch(self, arguments: dict[str, Any]) -> str:
+        # OR the queries together and let Solr split the hits back out with one
+        # group.query per query, so N lookups cost a single round-trip
+        queries = self._sanitize_json_like_strings(arguments.get("queries"))
+        if isinstance(queries, str):
+            queries = [queries]
+        if (
+            not isinstance(queries, list)
+            or not queries
+            or not all(isinstance(query, str) and query.strip() for query in queries)
+        ):
+            return "Error: queries parameter must be a non-empty list of strings"
+
+        return self._run_search_query(
+            {
+                "query": " OR ".join(f"({query})" for query in queries),
+                "fl": arguments.get("fl"),
+                "fq": arguments.get("fq"),
+                "group": True,
+                "group_query": queries,
+                "group_limit": arguments.get("rows", 10),
+                "group_sort": arguments.get("sort"),
+                "rows": len(queries),
+            },
+            group_label="Query",
+        )
@@ -1,37 +1,64 @@
-from typing import Any, Callable, Sequence
+import importlib.util
+from functools import cache
+from typing import TYPE_CHECKING, Any, Callable, Sequence
 
 import anyio
+import anyio.to_thread
 import click
 import mcp.types as types
 from mcp.server.lowlevel import Server
 from omegaconf import DictConfig
 
 from pdbe_mcp_server import get_config
-from pdbe_mcp_server.api_tools import create_mcp_tools_from_openapi
-from pdbe_mcp_server.graph_tools import GraphTools
-from pdbe_mcp_server.search_tools import SearchTools
 
-search_tools: SearchTools = SearchTools()
-graph_tools: GraphTools = GraphTools()
+if TYPE_CHECKING:
+    from pdbe_mcp_server.graph_tools import GraphTools
+    from pdbe_mcp_server.search_tools import SearchTools
 
 conf: DictConfig = get_config()
 
 
+# Backend modules are imported on first use so that starting one server type
+# does not load the tool modules of the others.
+@cache
+def get_search_tools() -> "SearchTools":
+    from pdbe_mcp_server.search_tools import SearchTools
+
+    return SearchTools()
+
+
+@cache
+def get_graph_tools() -> "GraphTools":
+    from pdbe_mcp_server.graph_tools import GraphTools
+
+    return GraphTools()
+
+
 class MCPServerFactory:
     """
     Factory class to create an MCP server instance.
+
+    Built servers are cached per name, so repeated creates reuse the same
+    wired-up instance.
     """
 
+    __slots__ = ("_builders", "_instances")
+
     def __init__(self) -> None:
         self._builders: dict[str, Callable[[], Server]] = {}
+        self._instances: dict[str, Server] = {}
 
     def register(self, name: str, builder_func: Callable[[], Server]) -> None:
         self._builders[name] = builder_func
+        self._instances.pop(name, None)
 
     def create(self, name: str) -> Server:
-        if name not in self._builders:
-            raise ValueError(f"No builder registered for {name}")
-        return self._builders[name]()
+        server = self._instances.get(name)
+        if server is None:
+            if name not in self._builders:
+                raise ValueError(f"No builder registered for {name}")
+            server = self._instances[name] = self._builders[name]()
+        return server
 
     def available_types(self) -> list[str]:
         return list(self._builders.keys())
@@ -42,6 +69,8 @@ factory = MCPServerFactory()
 
 
 def build_pdbe_api_server() -> Server:
+    from pdbe_mcp_server.api_tools import create_mcp_tools_from_openapi
+
     api_server = Server("pdbe-api-server")
     generator, available_tools = create_mcp_tools_from_openapi(conf.api.openapi_url)
 
@@ -55,30 +84,31 @@ def build_pdbe_api_server() -> Server:
     ) -> Sequence[types.TextContent | types.ImageContent | types.EmbeddedResource]:
         if arguments is None:
             arguments = {}
-        return generator.call_tool(name, arguments)
+        # The PDBe API request is blocking; run it off the event loop so
+        # concurrent tool calls are not serialized behind it.
+        return await anyio.to_thread.run_sync(generator.call_tool, name, arguments)
 
     return api_server
 
 
 def build_graph_server() -> Server:
+    from pdbe_mcp_server.graph_tools import _neo4j_enabled
+
     graph_server = Server("pdbe-graph-server")
+    graph_tools = get_graph_tools()
+
+    schema_tools = [
+        graph_tools.get_pdbe_graph_nodes_tool(),
+        graph_tools.get_pdbe_graph_edges_tool(),
+        graph_tools.get_pdbe_graph_node_relationships_tool(),
+        graph_tools.get_pdbe_graph_example_queries_tool(),
+    ]
+    cypher_tools = [*schema_tools, graph_tools.get_pdbe_run_cypher_query_tool()]
 
     @graph_server.list_tools()
     async def list_tools() -> list[types.Tool]:
-        tools = [
-            graph_tools.get_pdbe_graph_nodes_tool(),
-            graph_tools.get_pdbe_graph_edges_tool(),
-            graph_tools.get_pdbe_graph_node_relationships_tool(),
-            graph_tools.get_pdbe_graph_example_queries_tool(),
-        ]
-
         # Add the cypher query tool only if Neo4j is configured
-        from pdbe_mcp_server.graph_tools import _neo4j_enabled
-
-        if _neo4j_enabled():
-            tools.append(graph_tools.get_pdbe_run_cypher_query_tool())
-
-        return tools
+        return cypher_tools if _neo4j_enabled() else schema_tools
 
     @graph_server.call_tool()
     async def call_tool(
@@ -87,10 +117,14 @@ def build_graph_server() -> Server:
         if arguments is None:
             arguments = {}
 
+        # The graph schema is fetched on first use, so even the schema tools
+        # may block on HTTP; run them off the event loop
         if name == "pdbe_graph_nodes":
-            return [types.TextContent(text=graph_tools.format_nodes(), type="text")]
+            text = await anyio.to_thread.run_sync(graph_tools.format_nodes)
+            return [types.TextContent(text=text, type="text")]
         elif name == "pdbe_graph_edges":
-            return [types.TextContent(text=graph_tools.format_edges(), type="text")]
+            text = await anyio.to_thread.run_sync(graph_tools.format_edges)
+            return [types.TextContent(text=text, type="text")]
         elif name == "pdbe_graph_node_relationships":
             node_labels = arguments.get("node_labels", [])
             if not isinstance(node_labels, list):
@@ -101,18 +135,13 @@ def build_graph_server() -> Server:
                     )
                 ]
 
-            return [
-                types.TextContent(
-                    text=graph_tools.format_node_relationships(node_labels),
-                    type="text",
-                )
-            ]
+            text = await anyio.to_thread.run_sync(
+                graph_tools.format_node_relationships, node_labels
+            )
+            return [types.TextContent(text=text, type="text")]
         elif name == "pdbe_graph_example_queries":
-            return [
-                types.TextContent(
-                    text=graph_tools.format_example_queries(), type="text"
-                )
-            ]
+            text = await anyio.to_thread.run_sync(graph_tools.format_example_queries)
+            return [types.TextContent(text=text, type="text")]
         elif name == "pdbe_run_cypher_query":
             if not graph_tools:
                 return [
@@ -131,7 +160,9 @@ def build_graph_server() -> Server:
                 ]
 
             try:
-                result = graph_tools.execute_cypher_query(cypher_query)
+                result = await anyio.to_thread.run_sync(
+                    graph_tools.execute_cypher_query, cypher_query
+                )
                 return [types.TextContent(type="text", text=result)]
             except ValueError as e:
                 return [types.TextContent(type="text", text=str(e))]
@@ -152,29 +183,36 @@ and execute search queries against the PDBe database. Use these tools to help us
 in the PDBe database. Always make sure to understand the search schema before constructing queries.
         """,
     )
+    search_tools = get_search_tools()
+
+    available_tools = [
+        search_tools.get_search_schema_tool(),
+        search_tools.get_run_search_query_tool(),
+        search_tools.get_run_search_query_batch_tool(),
+    ]
 
     @search_server.list_tools()
     async def list_tools() -> list[types.Tool]:
-        return [
-            search_tools.get_search_schema_tool(),
-            search_tools.get_run_search_query_tool(),
-        ]
+        return available_tools
 
     @search_server.call_tool()
     async def call_tool(
         name: str, arguments: dict[str, Any]
     ) -> Sequence[types.TextContent | types.ImageContent | types.EmbeddedResource]:
+        # Solr requests are blocking; run them off the event loop
         if name == "get_search_schema":
-            return [
-                types.TextContent(type="text", text=search_tools.get_search_schema())
-            ]
+            text = await anyio.to_thread.run_sync(search_tools.get_search_schema)
+            return [types.TextContent(type="text", text=text)]
         elif name == "run_search_query":
-            return [
-                types.TextContent(
-                    type="text",
-                    text=search_tools.run_search_query(arguments),
-                )
-            ]
+            text = await anyio.to_thread.run_sync(
+                search_tools.run_search_query, arguments
+            )
+            return [types.TextContent(type="text", text=text)]
+        elif name == "run_search_query_batch":
+            text = await anyio.to_thread.run_sync(
+                search_tools.run_search_query_batch, arguments
+            )
+            return [types.TextContent(type="text", text=text)]
         else:
             raise ValueError(f"Unknown tool name: {name}")
 
@@ -246,7 +284,9 @@ def main(port: int, transport: str, server_type: str) -> int:
                     streams[0], streams[1], server.create_initialization_options()
                 )
 
-        anyio.run(arun)
+        # uvloop is an optional speed-up; uvicorn already picks it up for SSE
+        use_uvloop = importlib.util.find_spec("uvloop") is not None
+        anyio.run(arun, backend_options={"use_uvloop": use_uvloop})
 
     return 0
 
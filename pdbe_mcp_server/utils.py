@@ -1,10 +1,99 @@
+import atexit
+import html
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from html.parser import HTMLParser
+from pathlib import Path
 from typing import Any, Literal
+from urllib.parse import urlencode
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speed-up
+    orjson = None
+
+
+def dumps_json(data: Any, default: Any = None) -> str:
+    """
+    Serialize data as 2-space indented JSON text.
+
+    Uses orjson when it is installed and falls back to the standard library for
+    payloads orjson cannot encode (e.g. integers wider than 64 bits). With
+    orjson, non-ASCII text is not escaped and NaN/Infinity are written as null.
+
+    Args:
+        data: The object to serialize
+        default: Callable used to serialize otherwise unsupported objects
+
+    Returns:
+        The JSON text
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data,
+                default=default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            ).decode()
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2, default=default)
+
+
+def loads_json(text: str | bytes) -> Any:
+    """
+    Parse JSON text, using orjson when it is installed.
+
+    Args:
+        text: The JSON document
+
+    Returns:
+        The parsed object
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+# Markup the fast path can drop without a parser: comments without "-" or ">"
+# inside, start/end tags and declarations without quotes, and processing
+# instructions. Where the comment close and quoted attribute values are parsed
+# differently between Python versions, html.parser is left to decide.
+_HTML_TAG_RE = re.compile(
+    r"<!--[^>-]*-->|</?[a-zA-Z][^'\"<>]*>|<![a-zA-Z][^'\"<>]*>|<\?[^<>]*>"
+)
+# Elements whose content html.parser reads as raw text instead of markup
+_HTML_RAW_TEXT_RE = re.compile(
+    r"<(?:script|style|textarea|title|xmp|iframe|noembed|noframes|noscript|plaintext)\b",
+    re.IGNORECASE,
+)
+# Trailing text that html.parser holds back as a possibly incomplete reference
+# (it only looks at the last 34 characters of the input for one)
+_HTML_PENDING_REF_RE = re.compile(r"&[^\s;]*\Z")
+
+
+class _TextCollector(HTMLParser):
+    """
+    HTMLParser that collects the text chunks between markup.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.fed: list[str] = []
+
+    def handle_data(self, data: str) -> None:
+        self.fed.append(data)
+
 
 class HTMLStripper:
     """
@@ -12,21 +101,241 @@ class HTMLStripper:
     """
 
     @staticmethod
-    def strip_tags(html: str) -> str:
-        class _HTMLParser(HTMLParser):
-            def __init__(self) -> None:
-                super().__init__()
-                self.fed: list[str] = []
+    @lru_cache(maxsize=1024)
+    def strip_tags(html_text: str) -> str:
+        """
+        Remove HTML markup, joining the remaining text chunks with single spaces.
+
+        Simple markup is removed with a regex. Anything else (a bare "<", quoted
+        attributes, raw-text elements such as <script>, unterminated constructs)
+        is handed to html.parser, which the output is meant to match.
+        Results are memoized, as schema descriptions repeat across nodes and edges.
+
+        Args:
+            html_text: The string to strip
+
+        Returns:
+            The text content with character references unescaped
+        """
+        # Most schema strings are plain text: skip the regex and unescaping
+        if "<" not in html_text and "&" not in html_text:
+            return html_text
+
+        chunks = _HTML_TAG_RE.split(html_text)
+        if (
+            any("<" in chunk for chunk in chunks)
+            or _HTML_PENDING_REF_RE.search(chunks[-1][-34:])
+            or _HTML_RAW_TEXT_RE.search(html_text)
+        ):
+            parser = _TextCollector()
+            parser.feed(html_text)
+            return " ".join(parser.fed)
+
+        return " ".join(html.unescape(chunk) for chunk in chunks if chunk)
+
+
+class ResponseCache:
+    """
+    LRU cache of GET response bodies keyed by URL, with optional disk persistence.
+
+    Entries younger than ``ttl`` seconds are served without touching the network.
+    Older entries are revalidated with a conditional GET using the stored
+    ``ETag``/``Last-Modified`` validators, so an unchanged document costs one
+    304 round-trip instead of a full download.
+
+    Bodies are kept as text and parsed again by the caller on every hit, which
+    hands each caller a private payload and is cheaper than deep-copying one.
+    The cache is safe to use from several threads.
+    """
+
+    # Minimum seconds between the saves triggered by put()
+    SAVE_INTERVAL: float = 60.0
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        max_entries: int = 100,
+        ttl: float = 3600.0,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            path: JSON file used to persist entries between processes, or None
+                to keep the cache in memory only
+            max_entries: Maximum number of entries before the least recently
+                used one is evicted
+            ttl: Seconds an entry is considered fresh without revalidation
+        """
+        self.path: Path | None = path
+        self.max_entries: int = max_entries
+        self.ttl: float = ttl
+        self._entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._last_saved: float | None = None
+        self._load()
+
+    @staticmethod
+    def make_key(url: str, params: dict[str, Any] | None = None) -> str:
+        """
+        Build the cache key for a URL and its query parameters.
+
+        Args:
+            url: The requested URL
+            params: Query parameters
+
+        Returns:
+            The cache key
+        """
+        if not params:
+            return url
+        return f"{url}?{urlencode(sorted(params.items()), doseq=True)}"
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """
+        Look up an entry and mark it as most recently used.
 
-            def handle_data(self, data: str) -> None:
-                self.fed.append(data)
+        Args:
+            key: Cache key
+
+        Returns:
+            A copy of the entry with ``body``, ``etag``, ``last_modified`` and
+            ``stored_at`` fields, or None if the key is not cached
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return dict(entry)
+
+    def is_fresh(self, entry: dict[str, Any]) -> bool:
+        """
+        Check whether an entry can be served without revalidation.
+
+        Args:
+            entry: Cache entry returned by ``get``
+
+        Returns:
+            True if the entry is younger than the TTL
+        """
+        return time.time() - entry["stored_at"] < self.ttl
 
-            def get_data(self) -> str:
-                return " ".join(self.fed)
+    def put(
+        self,
+        key: str,
+        body: str,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """
+        Store an entry, evicting the least recently used one if the cache is full.
 
-        parser = _HTMLParser()
-        parser.feed(html)
-        return parser.get_data()
+        The cache is also saved to disk, at most once every ``SAVE_INTERVAL``
+        seconds, so that a killed process does not lose it.
+
+        Args:
+            key: Cache key
+            body: Response body text
+            etag: ``ETag`` response header, if any
+            last_modified: ``Last-Modified`` response header, if any
+        """
+        with self._lock:
+            self._entries[key] = {
+                "body": body,
+                "etag": etag,
+                "last_modified": last_modified,
+                "stored_at": time.time(),
+            }
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            save_due = self.path is not None and (
+                self._last_saved is None
+                or time.monotonic() - self._last_saved >= self.SAVE_INTERVAL
+            )
+        if save_due:
+            self.save()
+
+    def touch(self, key: str) -> None:
+        """
+        Reset the freshness timer of an entry after a successful revalidation.
+
+        Args:
+            key: Cache key
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries[key]["stored_at"] = time.time()
+
+    def clear(self) -> None:
+        """
+        Remove all entries from memory.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def _load(self) -> None:
+        """
+        Populate the cache from the persisted file.
+
+        Unreadable files and entries without a ``body`` or ``stored_at`` (hand
+        edited, or written by an older version) are ignored.
+        """
+        if self.path is None or not self.path.is_file():
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(entries, dict):
+            return
+        valid = [
+            (key, entry)
+            for key, entry in entries.items()
+            if isinstance(entry, dict)
+            and isinstance(entry.get("body"), str)
+            and isinstance(entry.get("stored_at"), (int, float))
+        ]
+        with self._lock:
+            for key, entry in valid[-self.max_entries :]:
+                self._entries[key] = entry
+
+    def save(self) -> None:
+        """
+        Atomically write the cache to disk if a path is configured.
+        """
+        if self.path is None:
+            return
+        with self._lock:
+            if not self._entries:
+                return
+            data = json.dumps(self._entries)
+            self._last_saved = time.monotonic()
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
+
+
+def _default_cache_path() -> Path:
+    """
+    Resolve the on-disk location of the HTTP response cache.
+
+    Returns:
+        ``$PDBE_MCP_CACHE_DIR/cache.json`` if set, otherwise
+        ``$XDG_CACHE_HOME/pdbe_mcp_server/cache.json`` (``~/.cache`` by default)
+    """
+    cache_dir = os.getenv("PDBE_MCP_CACHE_DIR")
+    if cache_dir:
+        return Path(cache_dir) / "cache.json"
+    cache_home = os.getenv("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(cache_home) / "pdbe_mcp_server" / "cache.json"
 
 
 class HTTPClient:
@@ -36,6 +345,22 @@ class HTTPClient:
     """
 
     _session: requests.Session | None = None
+    _retry_sessions: dict[tuple[int, float], requests.Session] = {}
+    _cache: ResponseCache | None = None
+    # Guards lazy creation only; the shared sessions themselves are used unlocked
+    _init_lock = threading.Lock()
+
+    # Connection pool sizing for the mounted adapters. All PDBe endpoints live on
+    # a handful of hosts, so a few pools with plenty of keep-alive slots each
+    # let concurrent tool calls reuse connections instead of re-handshaking.
+    # Overridable with PDBE_MCP_POOL_CONNECTIONS / PDBE_MCP_POOL_MAXSIZE.
+    POOL_CONNECTIONS: int = 10
+    POOL_MAXSIZE: int = 50
+
+    # Seconds to wait for a TCP connection to be established. Kept short (just
+    # above the 3s TCP retransmission window) so an unreachable host fails fast,
+    # while the per-call timeout bounds the wait for response data.
+    CONNECT_TIMEOUT: float = 3.05
 
     @classmethod
     def _get_session(cls) -> requests.Session:
@@ -46,18 +371,64 @@ class HTTPClient:
             Configured requests.Session instance
         """
         if cls._session is None:
-            cls._session = cls._create_session()
+            with cls._init_lock:
+                if cls._session is None:
+                    cls._session = cls._create_session()
         return cls._session
 
+    @classmethod
+    def _get_retry_session(
+        cls, max_retries: int, retry_delay: float
+    ) -> requests.Session:
+        """
+        Get or create a pooled session for a non-default retry configuration.
+
+        Args:
+            max_retries: Maximum number of retries
+            retry_delay: Delay between retries in seconds
+
+        Returns:
+            Configured requests.Session instance, reused for the same configuration
+        """
+        key = (max_retries, retry_delay)
+        session = cls._retry_sessions.get(key)
+        if session is None:
+            with cls._init_lock:
+                session = cls._retry_sessions.get(key)
+                if session is None:
+                    session = cls._create_session(max_retries, retry_delay)
+                    cls._retry_sessions[key] = session
+        return session
+
     @classmethod
     def close_session(cls) -> None:
         """
-        Close the singleton session and reset it.
+        Close the singleton session (and any custom-retry sessions) and reset it.
         Useful for cleanup or when you need to refresh the session.
         """
-        if cls._session is not None:
-            cls._session.close()
-            cls._session = None
+        with cls._init_lock:
+            if cls._session is not None:
+                cls._session.close()
+                cls._session = None
+            for session in cls._retry_sessions.values():
+                session.close()
+            cls._retry_sessions.clear()
+
+    @classmethod
+    def _get_cache(cls) -> ResponseCache:
+        """
+        Get or create the shared response cache, persisted to disk on exit.
+
+        Returns:
+            The process-wide ResponseCache instance
+        """
+        if cls._cache is None:
+            with cls._init_lock:
+                if cls._cache is None:
+                    cache = ResponseCache(path=_default_cache_path())
+                    atexit.register(cache.save)
+                    cls._cache = cache
+        return cls._cache
 
     @classmethod
     def _create_session(
@@ -80,7 +451,13 @@ class HTTPClient:
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["GET", "POST"],
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(
+            pool_connections=int(
+                os.getenv("PDBE_MCP_POOL_CONNECTIONS", cls.POOL_CONNECTIONS)
+            ),
+            pool_maxsize=int(os.getenv("PDBE_MCP_POOL_MAXSIZE", cls.POOL_MAXSIZE)),
+            max_retries=retry_strategy,
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         return session
@@ -92,7 +469,8 @@ class HTTPClient:
         response_type: Literal["json", "xml", "text"] = "json",
         max_retries: int = 3,
         retry_delay: float = 1.0,
-        timeout: int = 30,
+        timeout: float = 30,
+        use_cache: bool = False,
     ) -> Any:
         """
         Make an HTTP GET request with retry logic using the singleton session.
@@ -101,9 +479,11 @@ class HTTPClient:
             url: The URL to request
             params: Query parameters
             response_type: Type of response to return (json, xml, or text)
-            max_retries: Maximum number of retries (only used if session needs recreation)
-            retry_delay: Delay between retries in seconds (only used if session needs recreation)
-            timeout: Request timeout in seconds
+            max_retries: Maximum number of retries (non-default values use a separate pooled session)
+            retry_delay: Delay between retries in seconds (non-default values use a separate pooled session)
+            timeout: Read timeout in seconds (connecting is bounded by CONNECT_TIMEOUT)
+            use_cache: Serve the response from the shared ResponseCache, revalidating
+                stale entries with a conditional GET
 
         Returns:
             Parsed response based on response_type
@@ -113,19 +493,57 @@ class HTTPClient:
         """
         session = HTTPClient._get_session()
 
-        # If custom retry parameters are provided, create a temporary session
+        # If custom retry parameters are provided, use a session pooled for them
         if max_retries != 3 or retry_delay != 1.0:
-            session = HTTPClient._create_session(max_retries, retry_delay)
+            session = HTTPClient._get_retry_session(max_retries, retry_delay)
+
+        if not use_cache:
+            response = session.get(
+                url, params=params, timeout=(HTTPClient.CONNECT_TIMEOUT, timeout)
+            )
+            response.raise_for_status()
+            return HTTPClient._parse_response(response, response_type)
+
+        cache = HTTPClient._get_cache()
+        key = f"{response_type}:{ResponseCache.make_key(url, params)}"
+        entry = cache.get(key)
+        if entry is not None and cache.is_fresh(entry):
+            return HTTPClient._parse_cached_body(entry["body"], response_type)
+
+        headers = {}
+        if entry is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
 
-        response = session.get(url, params=params, timeout=timeout)
+        response = session.get(
+            url,
+            params=params,
+            timeout=(HTTPClient.CONNECT_TIMEOUT, timeout),
+            headers=headers,
+        )
+        if entry is not None and response.status_code == 304:
+            cache.touch(key)
+            return HTTPClient._parse_cached_body(entry["body"], response_type)
         response.raise_for_status()
 
+        payload = HTTPClient._parse_response(response, response_type)
         if response_type == "json":
-            return response.json()
-        elif response_type == "xml":
-            return response.text
-        else:  # text
-            return response.text
+            try:
+                body = response.content.decode("utf-8")
+            except UnicodeDecodeError:
+                # JSON is UTF-8 (RFC 8259); leave anything else uncached
+                return payload
+        else:
+            body = payload
+        cache.put(
+            key,
+            body,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        return payload
 
     @staticmethod
     def post(
@@ -135,7 +553,7 @@ class HTTPClient:
         response_type: Literal["json", "xml", "text"] = "json",
         max_retries: int = 3,
         retry_delay: float = 1.0,
-        timeout: int = 30,
+        timeout: float = 30,
     ) -> Any:
         """
         Make an HTTP POST request with retry logic using the singleton session.
@@ -145,9 +563,9 @@ class HTTPClient:
             data: Form data to send
             json: JSON data to send
             response_type: Type of response to return (json, xml, or text)
-            max_retries: Maximum number of retries (only used if session needs recreation)
-            retry_delay: Delay between retries in seconds (only used if session needs recreation)
-            timeout: Request timeout in seconds
+            max_retries: Maximum number of retries (non-default values use a separate pooled session)
+            retry_delay: Delay between retries in seconds (non-default values use a separate pooled session)
+            timeout: Read timeout in seconds (connecting is bounded by CONNECT_TIMEOUT)
 
         Returns:
             Parsed response based on response_type
@@ -157,16 +575,62 @@ class HTTPClient:
         """
         session = HTTPClient._get_session()
 
-        # If custom retry parameters are provided, create a temporary session
+        # If custom retry parameters are provided, use a session pooled for them
         if max_retries != 3 or retry_delay != 1.0:
-            session = HTTPClient._create_session(max_retries, retry_delay)
+            session = HTTPClient._get_retry_session(max_retries, retry_delay)
 
-        response = session.post(url, data=data, json=json, timeout=timeout)
+        response = session.post(
+            url, data=data, json=json, timeout=(HTTPClient.CONNECT_TIMEOUT, timeout)
+        )
         response.raise_for_status()
+        return HTTPClient._parse_response(response, response_type)
 
+    @staticmethod
+    def _parse_cached_body(
+        body: str, response_type: Literal["json", "xml", "text"]
+    ) -> Any:
+        """
+        Parse a body served from the ResponseCache according to the response type.
+
+        Args:
+            body: The cached response body text
+            response_type: Type of response to return (json, xml, or text)
+
+        Returns:
+            Parsed response based on response_type
+        """
         if response_type == "json":
+            return loads_json(body)
+        return body
+
+    @staticmethod
+    def _parse_response(
+        response: requests.Response, response_type: Literal["json", "xml", "text"]
+    ) -> Any:
+        """
+        Parse a response body according to the requested response type.
+
+        Args:
+            response: The HTTP response
+            response_type: Type of response to return (json, xml, or text)
+
+        Returns:
+            Parsed response based on response_type
+        """
+        if response_type == "json":
+            if orjson is not None:
+                try:
+                    return orjson.loads(response.content)
+                except orjson.JSONDecodeError:
+                    # orjson only reads UTF-8; let requests detect other encodings
+                    pass
             return response.json()
-        elif response_type == "xml":
+
+        # PDBe serves UTF-8. When the Content-Type names no charset, requests would
+        # either sniff the whole body (application/xml) or assume ISO-8859-1 (text/*)
+        if "charset=" not in response.headers.get("Content-Type", "").lower():
+            response.encoding = "utf-8"
+        if response_type == "xml":
             return response.text
         else:  # text
             return response.text
@@ -152,6 +152,7 @@ def mock_http_get(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
     """Mock HTTP GET requests."""
     mock = MagicMock()
     mock.return_value.status_code = 200
+    mock.return_value.content = b'{"test": "data"}'
     mock.return_value.json.return_value = {"test": "data"}
 
     def mock_session_get(*args: Any, **kwargs: Any) -> MagicMock:
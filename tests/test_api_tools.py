@@ -8,6 +8,7 @@ import requests
 
 from pdbe_mcp_server.api_tools import (
     OpenAPIToMCPGenerator,
+    _compile_path_template,
     create_mcp_tools_from_openapi,
 )
 
@@ -35,7 +36,9 @@ class TestOpenAPIToMCPGenerator:
 
         assert spec == mock_openapi_spec
         assert generator.openapi_spec == mock_openapi_spec
-        mock_get.assert_called_once_with("https://example.com/openapi.json")
+        mock_get.assert_called_once_with(
+            "https://example.com/openapi.json", use_cache=True
+        )
 
     @patch("pdbe_mcp_server.api_tools.HTTPClient.get")
     def test_load_openapi_spec_failure(self, mock_get: MagicMock) -> None:
@@ -132,9 +135,29 @@ class TestOpenAPIToMCPGenerator:
         assert tool_meta["name"] == "get_test"
         assert tool_meta["method"] == "GET"
         assert tool_meta["path"] == "/test/{id}"
+        assert tool_meta["url_template"] == [
+            "https://www.ebi.ac.uk/pdbe/api/v2/test/",
+            "id",
+            "",
+        ]
         assert "id" in tool_meta["path_params"]
         assert "format" in tool_meta["query_params"]
 
+    @patch("pdbe_mcp_server.api_tools.HTTPClient.get")
+    def test_list_tools_is_memoized(
+        self, mock_get: MagicMock, mock_openapi_spec: dict[str, Any]
+    ) -> None:
+        """Test that repeated list_tools calls reuse the generated tools."""
+        mock_get.return_value = mock_openapi_spec
+
+        generator = OpenAPIToMCPGenerator("https://example.com/openapi.json")
+        tools1 = generator.list_tools()
+        tools2 = generator.list_tools()
+
+        assert tools1 is tools2
+        assert len(generator.tools) == 1
+        mock_get.assert_called_once()
+
     @patch("pdbe_mcp_server.api_tools.HTTPClient.get")
     def test_call_tool_success(
         self, mock_get: MagicMock, mock_openapi_spec: dict[str, Any]
@@ -258,6 +281,26 @@ class TestOpenAPIToMCPGenerator:
         with pytest.raises(ValueError, match="Missing required path parameter"):
             generator.call_tool("get_test", {})
 
+    @patch("pdbe_mcp_server.api_tools.HTTPClient.get")
+    def test_call_tool_reports_all_missing_path_params(
+        self, mock_get: MagicMock, mock_openapi_spec: dict[str, Any]
+    ) -> None:
+        """Test that every missing path parameter is listed in the error."""
+        mock_openapi_spec["paths"]["/test/{id}"]["get"]["parameters"].append(
+            {"name": "chain", "in": "path", "required": True, "schema": {}}
+        )
+        mock_openapi_spec["paths"]["/test/{id}/{chain}"] = mock_openapi_spec[
+            "paths"
+        ].pop("/test/{id}")
+        mock_get.return_value = mock_openapi_spec
+
+        generator = OpenAPIToMCPGenerator("https://example.com/openapi.json")
+        generator.list_tools()
+
+        with pytest.raises(ValueError, match="path parameters: id, chain"):
+            generator.call_tool("get_test", {})
+        mock_get.assert_called_once()
+
     @patch("pdbe_mcp_server.api_tools.HTTPClient.get")
     def test_call_tool_request_exception(
         self, mock_get: MagicMock, mock_openapi_spec: dict[str, Any]
@@ -271,7 +314,7 @@ class TestOpenAPIToMCPGenerator:
         error = requests.RequestException("Server Error")
         error.response = mock_response
 
-        mock_get.side_effect = [mock_openapi_spec, error, error, error]
+        mock_get.side_effect = [mock_openapi_spec, error]
 
         generator = OpenAPIToMCPGenerator("https://example.com/openapi.json")
         generator.list_tools()
@@ -285,7 +328,8 @@ class TestOpenAPIToMCPGenerator:
         assert isinstance(result[0], TextContent)
         assert "API request failed" in result[0].text
         assert "500" in result[0].text
-        assert mock_get.call_count == 4
+        # Retries happen inside the HTTP session, not once more per tool call
+        assert mock_get.call_count == 2
 
     def test_extract_parameters(self) -> None:
         """Test parameter extraction."""
@@ -314,11 +358,32 @@ class TestOpenAPIToMCPGenerator:
 
         assert "id" in properties
         assert "limit" in properties
+        assert properties["id"]["description"] == "ID parameter\ntype: string"
         assert properties["limit"]["description"] == "Result limit"
         assert "id" in required
         assert "limit" not in required
 
 
+class TestCompilePathTemplate:
+    """Tests for _compile_path_template function."""
+
+    def test_multiple_params(self) -> None:
+        """Test splitting a path with several path parameters."""
+        segments = _compile_path_template(
+            "/pdb/entry/{pdb_id}/chain/{chain_id}", ["pdb_id", "chain_id"]
+        )
+        assert segments == ["/pdb/entry/", "pdb_id", "/chain/", "chain_id", ""]
+
+    def test_undeclared_placeholder_kept_literal(self) -> None:
+        """Test that placeholders without a declared parameter stay in the path."""
+        segments = _compile_path_template("/a/{x}/b/{y}", ["y"])
+        assert segments == ["/a/{x}/b/", "y", ""]
+
+    def test_no_params(self) -> None:
+        """Test a path without parameters."""
+        assert _compile_path_template("/status", []) == ["/status"]
+
+
 class TestCreateMCPToolsFromOpenAPI:
     """Tests for create_mcp_tools_from_openapi function."""
 
@@ -328,6 +393,7 @@ class TestCreateMCPToolsFromOpenAPI:
     ) -> None:
         """Test creating MCP tools from OpenAPI URL."""
         mock_get.return_value = mock_openapi_spec
+        create_mcp_tools_from_openapi.cache_clear()
 
         generator, tools = create_mcp_tools_from_openapi(
             "https://example.com/openapi.json"
@@ -336,3 +402,18 @@ class TestCreateMCPToolsFromOpenAPI:
         assert isinstance(generator, OpenAPIToMCPGenerator)
         assert len(tools) == 1
         assert tools[0].name == "get_test"
+
+    @patch("pdbe_mcp_server.api_tools.HTTPClient.get")
+    def test_create_mcp_tools_from_openapi_is_memoized(
+        self, mock_get: MagicMock, mock_openapi_spec: dict[str, Any]
+    ) -> None:
+        """Test that the same URL reuses one generator and tool list."""
+        mock_get.return_value = mock_openapi_spec
+        create_mcp_tools_from_openapi.cache_clear()
+
+        first = create_mcp_tools_from_openapi("https://example.com/openapi.json")
+        second = create_mcp_tools_from_openapi("https://example.com/openapi.json")
+        create_mcp_tools_from_openapi.cache_clear()
+
+        assert first is second
+        mock_get.assert_called_once()
@@ -1,9 +1,11 @@
 """Tests for graph_tools module."""
 
+import json
 from typing import Any
 from unittest.mock import MagicMock, patch
 
-from pdbe_mcp_server.graph_tools import GraphTools
+from pdbe_mcp_server.graph_tools import GraphTools, conf
+from pdbe_mcp_server.utils import HTTPClient, ResponseCache
 
 
 class TestGraphTools:
@@ -24,6 +26,20 @@ class TestGraphTools:
         assert tools.node_dict[1] == "Structure"
         assert tools.node_dict[2] == "Ligand"
 
+    @patch("pdbe_mcp_server.graph_tools.HTTPClient.get")
+    def test_initialization_is_lazy(
+        self, mock_get: MagicMock, mock_graph_schema: dict[str, Any]
+    ) -> None:
+        """Test that the schema is only fetched on first use, and only once."""
+        mock_get.return_value = mock_graph_schema
+
+        tools = GraphTools()
+        mock_get.assert_not_called()
+
+        tools.format_nodes()
+        tools.format_edges()
+        mock_get.assert_called_once()
+
     @patch("pdbe_mcp_server.graph_tools.HTTPClient.get")
     def test_get_nodes_strips_html(
         self, mock_get: MagicMock, mock_graph_schema: dict[str, Any]
@@ -52,6 +68,29 @@ class TestGraphTools:
         assert "<i>" not in edges[0]["description"]
         assert "ligand" in edges[0]["description"]
 
+    def test_cached_schema_is_cleaned_once_per_instance(self) -> None:
+        """Test that in-place cleaning does not leak into the shared response cache."""
+        schema = {
+            "nodes": [
+                {
+                    "id": 1,
+                    "label": "Entry",
+                    "title": "Entry",
+                    "description": "Ratio &lt;b&gt;x&lt;/b&gt; &amp;lt;5",
+                }
+            ],
+            "edges": [],
+        }
+        cache = ResponseCache()
+        cache.put(f"json:{conf.graph.schema_url}", json.dumps(schema))
+
+        with patch.object(HTTPClient, "_get_cache", return_value=cache):
+            first = GraphTools().nodes
+            second = GraphTools().nodes
+
+        assert first[0]["description"] == "Ratio <b>x</b> &lt;5"
+        assert second[0]["description"] == "Ratio <b>x</b> &lt;5"
+
     @patch("pdbe_mcp_server.graph_tools.HTTPClient.get")
     def test_format_nodes(
         self, mock_get: MagicMock, mock_graph_schema: dict[str, Any]
@@ -82,6 +121,22 @@ class TestGraphTools:
         assert "To: Ligand" in formatted
         assert "count" in formatted
 
+    @patch("pdbe_mcp_server.graph_tools.HTTPClient.get")
+    def test_format_nodes_and_edges_are_memoized(
+        self, mock_get: MagicMock, mock_graph_schema: dict[str, Any]
+    ) -> None:
+        """Test that formatted listings are built once and then reused."""
+        mock_get.return_value = mock_graph_schema
+
+        tools = GraphTools()
+
+        assert tools.format_nodes() is tools.format_nodes()
+        assert tools.format_edges() is tools.format_edges()
+        assert tools.format_nodes() is tools.nodes_text
+        assert tools.format_edges() is tools.edges_text
+        assert tools.format_example_queries() is tools.format_example_queries()
+        assert tools.format_example_queries() is tools.example_queries_text
+
     @patch("pdbe_mcp_server.graph_tools.HTTPClient.get")
     def test_format_node_relationships(
         self, mock_get: MagicMock, mock_graph_schema: dict[str, Any]
@@ -272,6 +327,21 @@ class TestGraphTools:
 
         assert "Properties: None" in formatted
 
+    def test_tool_definitions_are_shared(self) -> None:
+        """Test that tool getters return prebuilt instances without a fetch."""
+        with patch("pdbe_mcp_server.graph_tools.HTTPClient.get") as mock_get:
+            first, second = GraphTools(), GraphTools()
+            for getter in (
+                "get_pdbe_graph_nodes_tool",
+                "get_pdbe_graph_edges_tool",
+                "get_pdbe_graph_node_relationships_tool",
+                "get_pdbe_graph_example_queries_tool",
+                "get_pdbe_run_cypher_query_tool",
+            ):
+                assert getattr(first, getter)() is getattr(second, getter)()
+
+        mock_get.assert_not_called()
+
     @patch("pdbe_mcp_server.graph_tools.HTTPClient.get")
     def test_get_pdbe_graph_nodes_tool(
         self, mock_get: MagicMock, mock_graph_schema: dict[str, Any]
@@ -46,6 +46,13 @@ class TestSearchTools:
         assert tool.inputSchema["type"] == "object"
         assert len(tool.inputSchema["properties"]) == 0
 
+    def test_tool_definitions_are_shared(self) -> None:
+        """Test that tool getters return the same prebuilt instances."""
+        first, second = SearchTools(), SearchTools()
+
+        assert first.get_run_search_query_tool() is second.get_run_search_query_tool()
+        assert first.get_search_schema_tool() is second.get_search_schema_tool()
+
     @patch("pdbe_mcp_server.search_tools.HTTPClient.get")
     def test_get_search_schema(
         self, mock_get: MagicMock, mock_search_schema: dict[str, Any]
@@ -56,6 +63,8 @@ class TestSearchTools:
         tools = SearchTools()
         result = tools.get_search_schema()
 
+        mock_get.assert_called_once_with(tools.schema_url, use_cache=True)
+
         # Check header line
         assert "Field Name;Type;Stored;Indexed;Description" in result
 
@@ -69,6 +78,28 @@ class TestSearchTools:
         assert "text" in result
         assert "float" in result
 
+    @patch("pdbe_mcp_server.search_tools.HTTPClient.get")
+    def test_get_search_schema_is_cached(
+        self, mock_get: MagicMock, mock_search_schema: dict[str, Any]
+    ) -> None:
+        """Test that the formatted schema is reused until refreshed or expired."""
+        mock_get.return_value = mock_search_schema
+
+        tools = SearchTools()
+        first = tools.get_search_schema()
+        second = tools.get_search_schema()
+
+        assert first is second
+        assert mock_get.call_count == 1
+
+        tools.get_search_schema(refresh=True)
+        assert mock_get.call_count == 2
+
+        tools.SCHEMA_TTL = 0
+        tools.get_search_schema(refresh=True)
+        tools.get_search_schema()
+        assert mock_get.call_count == 4
+
     @patch("pdbe_mcp_server.search_tools.HTTPClient.get")
     def test_run_search_query_basic(
         self, mock_get: MagicMock, mock_search_response: dict[str, Any]
@@ -560,3 +591,77 @@ class TestSearchTools:
 
         assert "Number of documents found: 0" in result
         assert "Documents:" in result
+
+    def test_get_run_search_query_batch_tool(self) -> None:
+        """Test getting the batch search query MCP tool."""
+        tool = SearchTools().get_run_search_query_batch_tool()
+
+        assert tool.name == "run_search_query_batch"
+        assert tool.inputSchema["properties"]["queries"]["type"] == "array"
+        assert tool.inputSchema["required"] == ["queries"]
+
+    def test_batch_tool_schema_is_not_shared(self) -> None:
+        """Test that the batch tool does not alias the run tool's schema dicts."""
+        tools = SearchTools()
+        run = tools.get_run_search_query_tool().inputSchema["properties"]
+        batch = tools.get_run_search_query_batch_tool().inputSchema["properties"]
+
+        for name in ("fl", "fq"):
+            assert batch[name] == run[name]
+            assert batch[name] is not run[name]
+
+    @patch("pdbe_mcp_server.search_tools.HTTPClient.get")
+    def test_run_search_query_batch(self, mock_get: MagicMock) -> None:
+        """Test that batched queries are sent as one grouped Solr request."""
+        mock_get.return_value = {
+            "grouped": {
+                "pdb_id:1cbs": {
+                    "matches": 2,
+                    "doclist": {
+                        "numFound": 1,
+                        "start": 0,
+                        "docs": [{"pdb_id": "1cbs", "title": "CRABP II"}],
+                    },
+                },
+                "pdb_id:2abc": {
+                    "matches": 2,
+                    "doclist": {"numFound": 1, "start": 0, "docs": []},
+                },
+            }
+        }
+
+        tools = SearchTools()
+        result = tools.run_search_query_batch(
+            {
+                "queries": ["pdb_id:1cbs", "pdb_id:2abc"],
+                "fl": ["pdb_id", "title"],
+                "rows": 1,
+            }
+        )
+
+        mock_get.assert_called_once()
+        params = get_called_query_params(mock_get)
+        assert params["q"] == ["(pdb_id:1cbs) OR (pdb_id:2abc)"]
+        assert params["group"] == ["true"]
+        assert params["group.query"] == ["pdb_id:1cbs", "pdb_id:2abc"]
+        assert params["group.limit"] == ["1"]
+        assert params["rows"] == ["2"]
+        assert params["fl"] == ["pdb_id,title"]
+        assert "Query: pdb_id:1cbs" in result
+        assert "title: CRABP II" in result
+        assert "Query: pdb_id:2abc" in result
+        assert "Group field" not in result
+
+    @pytest.mark.parametrize(
+        "arguments",
+        [{"queries": []}, {"queries": "[]"}, {}, {"queries": ["pdb_id:1cbs", " "]}],
+    )
+    @patch("pdbe_mcp_server.search_tools.HTTPClient.get")
+    def test_run_search_query_batch_requires_queries(
+        self, mock_get: MagicMock, arguments: dict[str, Any]
+    ) -> None:
+        """Test that empty batches are rejected without sending rows=0 or q=''."""
+        result = SearchTools().run_search_query_batch(arguments)
+
+        assert "queries parameter" in result
+        mock_get.assert_not_called()
@@ -1,14 +1,23 @@
 """Tests for server module."""
 
+import subprocess
+import sys
+import threading
 from unittest.mock import MagicMock, patch
 
+import anyio
+import mcp.types as types
 import pytest
+from click.testing import CliRunner
 
 from pdbe_mcp_server.server import (
     MCPServerFactory,
     build_graph_server,
     build_pdbe_api_server,
     build_pdbe_search_server,
+    get_graph_tools,
+    get_search_tools,
+    main,
 )
 
 
@@ -19,6 +28,7 @@ class TestMCPServerFactory:
         """Test factory initialization."""
         factory = MCPServerFactory()
         assert factory._builders == {}
+        assert not hasattr(factory, "__dict__")
 
     def test_register_builder(self) -> None:
         """Test registering a builder function."""
@@ -43,6 +53,20 @@ class TestMCPServerFactory:
 
         assert server == mock_server
 
+    def test_create_server_is_memoized(self) -> None:
+        """Test that a server is built once and re-registering rebuilds it."""
+        factory = MCPServerFactory()
+        builder = MagicMock(side_effect=lambda: MagicMock())
+
+        factory.register("test_server", builder)
+        first = factory.create("test_server")
+
+        assert factory.create("test_server") is first
+        builder.assert_called_once()
+
+        factory.register("test_server", builder)
+        assert factory.create("test_server") is not first
+
     def test_create_unregistered_server(self) -> None:
         """Test creating an unregistered server raises error."""
         factory = MCPServerFactory()
@@ -66,10 +90,32 @@ class TestMCPServerFactory:
         assert "server2" in types
 
 
+class TestLazyBackends:
+    """Tests for the lazily created tool backends."""
+
+    def test_backend_accessors_return_singletons(self) -> None:
+        """Test that each backend is created once and then reused."""
+        assert get_search_tools() is get_search_tools()
+        assert get_graph_tools() is get_graph_tools()
+
+    def test_server_import_skips_backend_modules(self) -> None:
+        """Test that importing the server does not import the tool modules."""
+        code = (
+            "import sys, pdbe_mcp_server.server; "
+            "loaded = [m for m in ('api_tools', 'graph_tools', 'search_tools') "
+            "if f'pdbe_mcp_server.{m}' in sys.modules]; "
+            "print(','.join(loaded))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == ""
+
+
 class TestBuildPDBeAPIServer:
     """Tests for build_pdbe_api_server function."""
 
-    @patch("pdbe_mcp_server.server.create_mcp_tools_from_openapi")
+    @patch("pdbe_mcp_server.api_tools.create_mcp_tools_from_openapi")
     def test_build_pdbe_api_server(self, mock_create_tools: MagicMock) -> None:
         """Test building PDBe API server."""
         mock_generator = MagicMock()
@@ -85,9 +131,10 @@ class TestBuildPDBeAPIServer:
 class TestBuildGraphServer:
     """Tests for build_graph_server function."""
 
-    @patch("pdbe_mcp_server.server.graph_tools")
-    def test_build_graph_server(self, mock_graph_tools: MagicMock) -> None:
+    @patch("pdbe_mcp_server.server.get_graph_tools")
+    def test_build_graph_server(self, mock_get_graph_tools: MagicMock) -> None:
         """Test building graph server."""
+        mock_graph_tools = mock_get_graph_tools.return_value
         mock_graph_tools.get_pdbe_graph_nodes_tool.return_value = MagicMock()
         mock_graph_tools.get_pdbe_graph_edges_tool.return_value = MagicMock()
 
@@ -95,13 +142,73 @@ class TestBuildGraphServer:
 
         assert server.name == "pdbe-graph-server"
 
+    @pytest.mark.parametrize("neo4j_enabled", [True, False])
+    def test_graph_list_tools_reuses_prebuilt_lists(self, neo4j_enabled: bool) -> None:
+        """Test that list_tools returns tool lists built once with the server."""
+        request = types.ListToolsRequest(method="tools/list")
+
+        with patch(
+            "pdbe_mcp_server.graph_tools._neo4j_enabled", return_value=neo4j_enabled
+        ):
+            server = build_graph_server()
+            handler = server.request_handlers[types.ListToolsRequest]
+            first = anyio.run(handler, request).root.tools
+            second = anyio.run(handler, request).root.tools
+
+        names = [tool.name for tool in first]
+        assert ("pdbe_run_cypher_query" in names) is neo4j_enabled
+        assert [tool.name for tool in second] == names
+
+    @pytest.mark.parametrize(
+        ("name", "method", "arguments"),
+        [
+            ("pdbe_graph_nodes", "format_nodes", {}),
+            ("pdbe_graph_edges", "format_edges", {}),
+            (
+                "pdbe_graph_node_relationships",
+                "format_node_relationships",
+                {"node_labels": ["Entry"]},
+            ),
+            ("pdbe_graph_example_queries", "format_example_queries", {}),
+        ],
+    )
+    @patch("pdbe_mcp_server.server.get_graph_tools")
+    def test_graph_schema_tools_run_off_event_loop(
+        self,
+        mock_get_graph_tools: MagicMock,
+        name: str,
+        method: str,
+        arguments: dict[str, list[str]],
+    ) -> None:
+        """Test that schema tools, which may fetch the schema, run in a worker thread."""
+        called_from: list[threading.Thread] = []
+
+        def format_schema(*args: object) -> str:
+            called_from.append(threading.current_thread())
+            return "schema text"
+
+        getattr(mock_get_graph_tools.return_value, method).side_effect = format_schema
+
+        server = build_graph_server()
+        handler = server.request_handlers[types.CallToolRequest]
+        request = types.CallToolRequest(
+            method="tools/call",
+            params=types.CallToolRequestParams(name=name, arguments=arguments),
+        )
+
+        result = anyio.run(handler, request)
+
+        assert result.root.content[0].text == "schema text"
+        assert called_from and called_from[0] is not threading.main_thread()
+
 
 class TestBuildPDBeSearchServer:
     """Tests for build_pdbe_search_server function."""
 
-    @patch("pdbe_mcp_server.server.search_tools")
-    def test_build_search_server(self, mock_search_tools: MagicMock) -> None:
+    @patch("pdbe_mcp_server.server.get_search_tools")
+    def test_build_search_server(self, mock_get_search_tools: MagicMock) -> None:
         """Test building search server."""
+        mock_search_tools = mock_get_search_tools.return_value
         mock_search_tools.get_search_schema_tool.return_value = MagicMock()
         mock_search_tools.get_run_search_query_tool.return_value = MagicMock()
 
@@ -111,3 +218,71 @@ class TestBuildPDBeSearchServer:
         # Check that instructions are provided
         assert server.instructions is not None
         assert "search" in server.instructions.lower()
+
+    @patch("pdbe_mcp_server.server.get_search_tools")
+    def test_search_call_tool_runs_query(
+        self, mock_get_search_tools: MagicMock
+    ) -> None:
+        """Test that the search call_tool handler returns the query output."""
+        mock_search_tools = mock_get_search_tools.return_value
+        mock_search_tools.run_search_query.return_value = "search results"
+
+        server = build_pdbe_search_server()
+        handler = server.request_handlers[types.CallToolRequest]
+        request = types.CallToolRequest(
+            method="tools/call",
+            params=types.CallToolRequestParams(
+                name="run_search_query", arguments={"query": "*:*"}
+            ),
+        )
+
+        result = anyio.run(handler, request)
+
+        assert result.root.content[0].text == "search results"
+        mock_search_tools.run_search_query.assert_called_once_with({"query": "*:*"})
+
+    @patch("pdbe_mcp_server.server.get_search_tools")
+    def test_search_call_tool_runs_batch_query(
+        self, mock_get_search_tools: MagicMock
+    ) -> None:
+        """Test that the search call_tool handler dispatches batched queries."""
+        mock_search_tools = mock_get_search_tools.return_value
+        mock_search_tools.run_search_query_batch.return_value = "batch results"
+
+        server = build_pdbe_search_server()
+        handler = server.request_handlers[types.CallToolRequest]
+        request = types.CallToolRequest(
+            method="tools/call",
+            params=types.CallToolRequestParams(
+                name="run_search_query_batch",
+                arguments={"queries": ["pdb_id:1cbs"]},
+            ),
+        )
+
+        result = anyio.run(handler, request)
+
+        assert result.root.content[0].text == "batch results"
+        mock_search_tools.run_search_query_batch.assert_called_once_with(
+            {"queries": ["pdb_id:1cbs"]}
+        )
+
+
+class TestMain:
+    """Tests for the command-line entry point."""
+
+    @pytest.mark.parametrize("installed", [True, False])
+    def test_stdio_uses_uvloop_when_installed(self, installed: bool) -> None:
+        """Test that the stdio transport requests uvloop only if it is importable."""
+        spec = MagicMock() if installed else None
+
+        with (
+            patch("pdbe_mcp_server.server.MCPServerFactory.create"),
+            patch("pdbe_mcp_server.server.importlib.util.find_spec", return_value=spec),
+            patch("pdbe_mcp_server.server.anyio.run") as mock_run,
+        ):
+            result = CliRunner().invoke(main, ["--server-type", "pdbe_search_server"])
+
+        assert result.exit_code == 0
+        assert mock_run.call_args.kwargs == {
+            "backend_options": {"use_uvloop": installed}
+        }
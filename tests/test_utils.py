@@ -1,11 +1,79 @@
 """Tests for utils module."""
 
-from unittest.mock import MagicMock, patch
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
 import requests
 
-from pdbe_mcp_server.utils import HTMLStripper, HTTPClient
+from pdbe_mcp_server import utils
+from pdbe_mcp_server.utils import (
+    HTMLStripper,
+    HTTPClient,
+    ResponseCache,
+    dumps_json,
+    loads_json,
+)
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(
+    request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+) -> str:
+    """Run a test once with orjson (when installed) and once with json."""
+    if request.param == "orjson":
+        if utils.orjson is None:
+            pytest.skip("orjson is not installed")
+    else:
+        monkeypatch.setattr(utils, "orjson", None)
+    return request.param
+
+
+class TestDumpsJson:
+    """Tests for dumps_json function."""
+
+    def test_matches_stdlib_output_for_ascii(self, json_backend: str) -> None:
+        """Test that ASCII output matches json.dumps with indent=2."""
+        data = {"a": [1, 2, {"b": None}], "c": "text", 1: True}
+        assert dumps_json(data) == json.dumps(data, indent=2)
+
+    def test_non_ascii(self, json_backend: str) -> None:
+        """Test that only the stdlib backend escapes non-ASCII characters."""
+        expected = '"caf\\u00e9"' if json_backend == "stdlib" else '"caf\u00e9"'
+        assert dumps_json("caf\u00e9") == expected
+
+    def test_non_finite_floats(self, json_backend: str) -> None:
+        """Test that orjson writes NaN and Infinity as null."""
+        expected = "NaN" if json_backend == "stdlib" else "null"
+        assert dumps_json(float("nan")) == expected
+
+    def test_default_serializer(self, json_backend: str) -> None:
+        """Test that unsupported objects go through the default callable."""
+        result = dumps_json({"value": {1, 2}.__class__}, default=str)
+        assert "class 'set'" in result
+
+    def test_wide_integer(self, json_backend: str) -> None:
+        """Test integers orjson cannot encode still serialize."""
+        assert dumps_json(2**70) == str(2**70)
+
+
+class TestLoadsJson:
+    """Tests for loads_json function."""
+
+    @pytest.mark.parametrize("text", ['{"a": [1, "caf\u00e9"]}', b'{"a": [1, "x"]}'])
+    def test_matches_stdlib(self, json_backend: str, text: str | bytes) -> None:
+        """Test that parsing str and bytes matches json.loads."""
+        assert loads_json(text) == json.loads(text)
+
+    def test_invalid_json_raises_value_error(self, json_backend: str) -> None:
+        """Test that both backends raise a ValueError subclass."""
+        with pytest.raises(ValueError):
+            loads_json("{")
 
 
 class TestHTMLStripper:
@@ -17,6 +85,16 @@ class TestHTMLStripper:
         result = HTMLStripper.strip_tags(html)
         assert result == "Hello World"
 
+    def test_strip_tags_is_memoized(self) -> None:
+        """Test that repeated inputs are served from the cache."""
+        HTMLStripper.strip_tags.cache_clear()
+        first = HTMLStripper.strip_tags("<p>Repeated &amp; cached</p>")
+        second = HTMLStripper.strip_tags("<p>Repeated &amp; cached</p>")
+
+        assert first == second == "Repeated & cached"
+        info = HTMLStripper.strip_tags.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
     def test_strip_nested_tags(self) -> None:
         """Test stripping nested HTML tags."""
         html = "<div><p>Hello<span><strong>World</strong></span></p></div>"
@@ -40,6 +118,49 @@ class TestHTMLStripper:
         result = HTMLStripper.strip_tags(text)
         assert result == "Hello World"
 
+    def test_unescapes_entities(self) -> None:
+        """Test that character references are decoded."""
+        html = "<p>A &amp; B &lt;C&gt;</p>"
+        result = HTMLStripper.strip_tags(html)
+        assert result == "A & B <C>"
+
+    def test_plain_text_returned_unchanged(self) -> None:
+        """Test that strings without markup are returned as-is."""
+        text = "Plain  text\nwith spacing"
+        assert HTMLStripper.strip_tags(text) is text
+
+    def test_entities_without_tags_are_unescaped(self) -> None:
+        """Test that character references are decoded even without tags."""
+        assert HTMLStripper.strip_tags("A &amp; B") == "A & B"
+
+    @pytest.mark.parametrize(
+        ("html", "expected"),
+        [
+            # Expected values are the output of the original HTMLParser stripper
+            ("x <!-- c > d --> y", "x   y"),
+            ("a\n<!--\nm\n-->b", "a\n b"),
+            ("<script>if(a<b){}</script>ok", "if(a<b){} ok"),
+            ("<style>p>a{}</style>t", "p>a{} t"),
+            ("a < b and c > d", "a  <  b and c > d"),
+            ("1 <= 2", "1  < = 2"),
+            ("x<</b>y", "x < y"),
+            ("a <b", "a "),
+            ("<p>t</p>tail &amp", "t"),
+            ("x <!DOCTYPE html> y", "x   y"),
+            ("<tit=a9'ple>'&gt]]><b>", "'>]]>"),
+            ("<a title='x>y'>L</a>", "L"),
+        ],
+    )
+    def test_matches_html_parser(self, html: str, expected: str) -> None:
+        """Test parity with html.parser for comments, raw text and bare '<'."""
+        assert HTMLStripper.strip_tags(html) == expected
+
+    def test_quoted_attribute_with_angle_bracket(self) -> None:
+        """Test that '>' inside a quoted attribute value does not end the tag."""
+        html = "<a title='x>y'>Link</a>"
+        result = HTMLStripper.strip_tags(html)
+        assert result == "Link"
+
     def test_multiple_spaces(self) -> None:
         """Test that multiple spaces are preserved as single space."""
         html = "<p>Hello</p>   <p>World</p>"
@@ -76,6 +197,7 @@ class TestHTTPClient:
         """Test successful JSON GET request."""
         mock_response = MagicMock()
         mock_response.status_code = 200
+        mock_response.content = b'{"key": "value"}'
         mock_response.json.return_value = {"key": "value"}
 
         mock_session = MagicMock()
@@ -86,6 +208,39 @@ class TestHTTPClient:
             assert result == {"key": "value"}
             mock_session.get.assert_called_once()
 
+    def test_get_json_decodes_raw_content(self) -> None:
+        """Test that JSON bodies are decoded from the raw response bytes."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"key": ["value", 1]}'
+        mock_response.json.return_value = {"key": ["value", 1]}
+
+        mock_session = MagicMock()
+        mock_session.get.return_value = mock_response
+
+        with patch.object(HTTPClient, "_get_session", return_value=mock_session):
+            result = HTTPClient.get("https://example.com")
+
+        assert result == {"key": ["value", 1]}
+        if utils.orjson is not None:
+            mock_response.json.assert_not_called()
+
+    def test_get_json_falls_back_for_non_utf8_content(self) -> None:
+        """Test that bodies orjson cannot decode are parsed by requests."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = '{"name": "caf\u00e9"}'.encode("latin-1")
+        mock_response.json.return_value = {"name": "caf\u00e9"}
+
+        mock_session = MagicMock()
+        mock_session.get.return_value = mock_response
+
+        with patch.object(HTTPClient, "_get_session", return_value=mock_session):
+            result = HTTPClient.get("https://example.com")
+
+        assert result == {"name": "caf\u00e9"}
+        mock_response.json.assert_called_once()
+
     def test_get_text_success(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test successful text GET request."""
         mock_response = MagicMock()
@@ -112,10 +267,58 @@ class TestHTTPClient:
             result = HTTPClient.get("https://example.com", response_type="xml")
             assert result == "<xml>data</xml>"
 
+    def test_get_xml_without_charset_is_decoded_as_utf8(self) -> None:
+        """Test that bodies without a declared charset are not sniffed."""
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = "application/xml"
+        response._content = "<name>caf\u00e9</name>".encode()
+
+        mock_session = MagicMock()
+        mock_session.get.return_value = response
+
+        with (
+            patch.object(HTTPClient, "_get_session", return_value=mock_session),
+            patch.object(
+                requests.Response, "apparent_encoding", new_callable=PropertyMock
+            ) as mock_apparent,
+        ):
+            result = HTTPClient.get("https://example.com", response_type="xml")
+
+        assert result == "<name>caf\u00e9</name>"
+        assert response.encoding == "utf-8"
+        mock_apparent.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("content_type", "expected"),
+        [
+            ("text/plain", "caf\u00e9"),
+            ("text/xml", "caf\u00e9"),
+            ("text/plain; charset=ISO-8859-1", "caf\u00c3\u00a9"),
+        ],
+    )
+    def test_get_text_charset(self, content_type: str, expected: str) -> None:
+        """Test that text/* bodies default to UTF-8 unless a charset is declared."""
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = content_type
+        # As set by the transport adapter when it builds the response
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response._content = "caf\u00e9".encode()
+
+        mock_session = MagicMock()
+        mock_session.get.return_value = response
+
+        with patch.object(HTTPClient, "_get_session", return_value=mock_session):
+            result = HTTPClient.get("https://example.com", response_type="text")
+
+        assert result == expected
+
     def test_get_with_params(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test GET request with parameters."""
         mock_response = MagicMock()
         mock_response.status_code = 200
+        mock_response.content = b'{"result": "data"}'
         mock_response.json.return_value = {"result": "data"}
 
         mock_session = MagicMock()
@@ -127,7 +330,9 @@ class TestHTTPClient:
             result = HTTPClient.get("https://example.com", params=params)
             assert result == {"result": "data"}
             mock_session.get.assert_called_once_with(
-                "https://example.com", params=params, timeout=30
+                "https://example.com",
+                params=params,
+                timeout=(HTTPClient.CONNECT_TIMEOUT, 30),
             )
 
     def test_get_http_error(self, monkeypatch: pytest.MonkeyPatch) -> None:
@@ -147,6 +352,7 @@ class TestHTTPClient:
         """Test successful JSON POST request."""
         mock_response = MagicMock()
         mock_response.status_code = 200
+        mock_response.content = b'{"status": "created"}'
         mock_response.json.return_value = {"status": "created"}
 
         mock_session = MagicMock()
@@ -158,13 +364,17 @@ class TestHTTPClient:
             result = HTTPClient.post("https://example.com", json=json_data)
             assert result == {"status": "created"}
             mock_session.post.assert_called_once_with(
-                "https://example.com", data=None, json=json_data, timeout=30
+                "https://example.com",
+                data=None,
+                json=json_data,
+                timeout=(HTTPClient.CONNECT_TIMEOUT, 30),
             )
 
     def test_post_form_data(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test POST request with form data."""
         mock_response = MagicMock()
         mock_response.status_code = 200
+        mock_response.content = b'{"status": "ok"}'
         mock_response.json.return_value = {"status": "ok"}
 
         mock_session = MagicMock()
@@ -176,7 +386,10 @@ class TestHTTPClient:
             result = HTTPClient.post("https://example.com", data=form_data)
             assert result == {"status": "ok"}
             mock_session.post.assert_called_once_with(
-                "https://example.com", data=form_data, json=None, timeout=30
+                "https://example.com",
+                data=form_data,
+                json=None,
+                timeout=(HTTPClient.CONNECT_TIMEOUT, 30),
             )
 
     def test_post_http_error(self, monkeypatch: pytest.MonkeyPatch) -> None:
@@ -198,6 +411,7 @@ class TestHTTPClient:
         """Test request with custom timeout."""
         mock_response = MagicMock()
         mock_response.status_code = 200
+        mock_response.content = b"{}"
         mock_response.json.return_value = {}
 
         mock_session = MagicMock()
@@ -206,13 +420,16 @@ class TestHTTPClient:
         with patch.object(HTTPClient, "_get_session", return_value=mock_session):
             HTTPClient.get("https://example.com", timeout=60)
             mock_session.get.assert_called_once_with(
-                "https://example.com", params=None, timeout=60
+                "https://example.com",
+                params=None,
+                timeout=(HTTPClient.CONNECT_TIMEOUT, 60),
             )
 
     def test_custom_retry_parameters(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test that custom retry parameters create a temporary session."""
         mock_response = MagicMock()
         mock_response.status_code = 200
+        mock_response.content = b"{}"
         mock_response.json.return_value = {}
 
         mock_temp_session = MagicMock()
@@ -232,6 +449,46 @@ class TestHTTPClient:
             mock_temp_session.get.assert_called_once()
             mock_singleton_session.get.assert_not_called()
 
+    def test_concurrent_first_use_creates_one_session(self) -> None:
+        """Test that racing threads share a single lazily created session."""
+        HTTPClient.close_session()
+        barrier = threading.Barrier(8)
+        created: list[requests.Session] = []
+        create_session = HTTPClient._create_session
+
+        def slow_create(*args: Any, **kwargs: Any) -> requests.Session:
+            session = create_session(*args, **kwargs)
+            created.append(session)
+            time.sleep(0.01)
+            return session
+
+        def worker() -> requests.Session:
+            barrier.wait()
+            return HTTPClient._get_session()
+
+        with (
+            patch.object(HTTPClient, "_create_session", side_effect=slow_create),
+            ThreadPoolExecutor(max_workers=8) as executor,
+        ):
+            sessions = list(executor.map(lambda _: worker(), range(8)))
+
+        assert len(created) == 1
+        assert all(session is created[0] for session in sessions)
+        HTTPClient.close_session()
+
+    def test_custom_retry_session_is_reused(self) -> None:
+        """Test that sessions for the same custom retry parameters are pooled."""
+        session1 = HTTPClient._get_retry_session(5, 2.0)
+        session2 = HTTPClient._get_retry_session(5, 2.0)
+        session3 = HTTPClient._get_retry_session(1, 0.5)
+
+        assert session1 is session2
+        assert session1 is not session3
+        assert session1 is not HTTPClient._get_session()
+
+        HTTPClient.close_session()
+        assert HTTPClient._retry_sessions == {}
+
     def test_create_session_method(self) -> None:
         """Test the _create_session helper method."""
         session = HTTPClient._create_session(max_retries=5, retry_delay=2.0)
@@ -240,12 +497,31 @@ class TestHTTPClient:
         assert "http://" in session.adapters
         assert "https://" in session.adapters
 
+    def test_create_session_pool_size(self) -> None:
+        """Test that mounted adapters use the configured connection pool sizes."""
+        session = HTTPClient._create_session()
+        adapter = session.adapters["https://"]
+        assert adapter._pool_connections == HTTPClient.POOL_CONNECTIONS
+        assert adapter._pool_maxsize == HTTPClient.POOL_MAXSIZE
+
+    def test_create_session_pool_size_from_env(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that pool sizes can be overridden with environment variables."""
+        monkeypatch.setenv("PDBE_MCP_POOL_CONNECTIONS", "4")
+        monkeypatch.setenv("PDBE_MCP_POOL_MAXSIZE", "16")
+        session = HTTPClient._create_session()
+        adapter = session.adapters["https://"]
+        assert adapter._pool_connections == 4
+        assert adapter._pool_maxsize == 16
+
     def test_default_retry_uses_singleton(
         self, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Test that default retry parameters use the singleton session."""
         mock_response = MagicMock()
         mock_response.status_code = 200
+        mock_response.content = b"{}"
         mock_response.json.return_value = {}
 
         mock_session = MagicMock()
@@ -256,3 +532,194 @@ class TestHTTPClient:
             mock_session.get.assert_called_once()
             # Should not call mount on the mocked singleton session
             mock_session.mount.assert_not_called()
+
+    def test_get_with_cache_serves_fresh_entry(self) -> None:
+        """Test that a fresh cached entry is returned without a request."""
+        cache = ResponseCache()
+        cache.put("json:https://example.com", '{"cached": true}')
+
+        mock_session = MagicMock()
+
+        with (
+            patch.object(HTTPClient, "_get_session", return_value=mock_session),
+            patch.object(HTTPClient, "_get_cache", return_value=cache),
+        ):
+            result = HTTPClient.get("https://example.com", use_cache=True)
+
+        assert result == {"cached": True}
+        mock_session.get.assert_not_called()
+
+    def test_get_with_cache_returns_private_copy(self) -> None:
+        """Test that modifying a cached result does not change later hits."""
+        cache = ResponseCache()
+        cache.put("json:https://example.com", '{"nodes": ["&lt;b&gt;"]}')
+
+        with (
+            patch.object(HTTPClient, "_get_session", return_value=MagicMock()),
+            patch.object(HTTPClient, "_get_cache", return_value=cache),
+        ):
+            first = HTTPClient.get("https://example.com", use_cache=True)
+            first["nodes"][0] = "<b>"
+            second = HTTPClient.get("https://example.com", use_cache=True)
+
+        assert second == {"nodes": ["&lt;b&gt;"]}
+
+    def test_get_with_cache_revalidates_stale_entry(self) -> None:
+        """Test that a stale entry is revalidated and reused on 304."""
+        cache = ResponseCache(ttl=0)
+        cache.put("json:https://example.com", '{"cached": true}', etag='"v1"')
+
+        mock_response = MagicMock()
+        mock_response.status_code = 304
+
+        mock_session = MagicMock()
+        mock_session.get.return_value = mock_response
+
+        with (
+            patch.object(HTTPClient, "_get_session", return_value=mock_session),
+            patch.object(HTTPClient, "_get_cache", return_value=cache),
+        ):
+            result = HTTPClient.get("https://example.com", use_cache=True)
+
+        assert result == {"cached": True}
+        mock_session.get.assert_called_once_with(
+            "https://example.com",
+            params=None,
+            timeout=(HTTPClient.CONNECT_TIMEOUT, 30),
+            headers={"If-None-Match": '"v1"'},
+        )
+        mock_response.json.assert_not_called()
+
+    def test_get_with_cache_stores_response(self) -> None:
+        """Test that a cache miss stores the response body and validators."""
+        cache = ResponseCache()
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"key": "value"}'
+        mock_response.json.return_value = {"key": "value"}
+        mock_response.headers = {"ETag": '"v2"'}
+
+        mock_session = MagicMock()
+        mock_session.get.return_value = mock_response
+
+        with (
+            patch.object(HTTPClient, "_get_session", return_value=mock_session),
+            patch.object(HTTPClient, "_get_cache", return_value=cache),
+        ):
+            result = HTTPClient.get("https://example.com", use_cache=True)
+
+        assert result == {"key": "value"}
+        entry = cache.get("json:https://example.com")
+        assert entry is not None
+        assert entry["body"] == '{"key": "value"}'
+        assert entry["etag"] == '"v2"'
+
+
+class TestResponseCache:
+    """Tests for ResponseCache class."""
+
+    def test_lru_eviction(self) -> None:
+        """Test that the least recently used entry is evicted."""
+        cache = ResponseCache(max_entries=2)
+        cache.put("a", "1")
+        cache.put("b", "2")
+        cache.get("a")
+        cache.put("c", "3")
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+
+    def test_freshness(self) -> None:
+        """Test TTL-based freshness checks."""
+        cache = ResponseCache(ttl=60)
+        cache.put("a", "1")
+        entry = cache.get("a")
+        assert entry is not None
+        assert cache.is_fresh(entry)
+
+        entry["stored_at"] -= 120
+        assert not cache.is_fresh(entry)
+
+    def test_make_key_sorts_params(self) -> None:
+        """Test that cache keys do not depend on parameter order."""
+        key1 = ResponseCache.make_key("https://example.com", {"b": 2, "a": 1})
+        key2 = ResponseCache.make_key("https://example.com", {"a": 1, "b": 2})
+        assert key1 == key2 == "https://example.com?a=1&b=2"
+        assert ResponseCache.make_key("https://example.com") == "https://example.com"
+
+    def test_save_and_load(self, tmp_path: Path) -> None:
+        """Test that entries survive a save/load round-trip."""
+        path = tmp_path / "cache" / "cache.json"
+        cache = ResponseCache(path=path)
+        cache.put("a", '{"value": 1}', etag='"v1"')
+        cache.save()
+
+        reloaded = ResponseCache(path=path)
+        entry = reloaded.get("a")
+        assert entry is not None
+        assert entry["body"] == '{"value": 1}'
+        assert entry["etag"] == '"v1"'
+
+    def test_put_saves_with_throttling(self, tmp_path: Path) -> None:
+        """Test that put persists the cache, at most once per SAVE_INTERVAL."""
+        path = tmp_path / "cache.json"
+        cache = ResponseCache(path=path)
+
+        cache.put("a", "1")
+        assert ResponseCache(path=path).get("a") is not None
+
+        cache.put("b", "2")
+        assert ResponseCache(path=path).get("b") is None
+
+        cache.SAVE_INTERVAL = 0
+        cache.put("c", "3")
+        reloaded = ResponseCache(path=path)
+        assert reloaded.get("b") is not None
+        assert reloaded.get("c") is not None
+
+    def test_load_drops_invalid_entries(self, tmp_path: Path) -> None:
+        """Test that entries missing a body or timestamp are not loaded."""
+        path = tmp_path / "cache.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "valid": {"body": "{}", "stored_at": time.time()},
+                    "old-format": {"payload": {}, "stored_at": time.time()},
+                    "no-timestamp": {"body": "{}"},
+                    "not-a-dict": [],
+                }
+            )
+        )
+
+        cache = ResponseCache(path=path)
+
+        assert cache.get("valid") is not None
+        assert cache.get("old-format") is None
+        assert cache.get("no-timestamp") is None
+        assert cache.get("not-a-dict") is None
+
+    def test_concurrent_get_and_put(self) -> None:
+        """Test that lookups racing with evictions do not raise."""
+        cache = ResponseCache(max_entries=2)
+
+        def churn(worker: int) -> None:
+            for i in range(2000):
+                key = f"{worker}-{i % 5}"
+                cache.put(key, "{}")
+                cache.get(key)
+                cache.touch(key)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(churn, range(8)))
+
+        assert len(cache._entries) == 2
+
+    def test_load_ignores_corrupt_file(self, tmp_path: Path) -> None:
+        """Test that an unreadable cache file is ignored."""
+        path = tmp_path / "cache.json"
+        path.write_text("not json")
+
+        cache = ResponseCache(path=path)
+        assert cache.get("a") is None